@@ -1,28 +1,40 @@
 """Configuration registry for evaluation types.
 
-Maps eval_type strings to their evaluator configurations.
+Maps eval_type strings to their evaluator configurations. Evaluator
+classes are referenced as "module:ClassName" strings and imported on
+first use - each request handles exactly one eval_type, so eagerly
+importing strands_evals and every custom evaluator at module load would
+pay the full import cost on every cold start.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Type
-from strands_evals.evaluators import (
-    Evaluator,
-    HelpfulnessEvaluator,
-    FaithfulnessEvaluator,
-    GoalSuccessRateEvaluator,
-    ToolSelectionAccuracyEvaluator,
-)
-from evaluators import (
-    ConciseResponseEvaluator,
-    ReleaseNotesStructureEvaluator,
-    TurnEfficiencyEvaluator,
-)
-
-
-@dataclass
+import functools
+import importlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from strands_evals.evaluators import Evaluator
+
+
+_resolved_classes: dict[str, "Type[Evaluator]"] = {}
+
+
+def _resolve_evaluator(spec: "Union[str, Type[Evaluator]]") -> "Type[Evaluator]":
+    """Resolve a "module:ClassName" spec to the evaluator class."""
+    if not isinstance(spec, str):
+        return spec
+    cls = _resolved_classes.get(spec)
+    if cls is None:
+        module_name, _, class_name = spec.partition(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _resolved_classes[spec] = cls
+    return cls
+
+
+@dataclass(slots=True)
 class EvalConfig:
     """Configuration for a specific evaluation type."""
-    evaluators: list[Type[Evaluator]]
+    evaluators: "list[Type[Evaluator]]"
     description: str
     sop_file: Optional[str] = None
 
@@ -30,38 +42,40 @@ class EvalConfig:
 EVAL_CONFIGS: dict[str, EvalConfig] = {
     "github_issue": EvalConfig(
         evaluators=[
-            HelpfulnessEvaluator,
-            GoalSuccessRateEvaluator,
-            ToolSelectionAccuracyEvaluator,
-            TurnEfficiencyEvaluator,
-            ConciseResponseEvaluator,
+            "strands_evals.evaluators:HelpfulnessEvaluator",
+            "strands_evals.evaluators:GoalSuccessRateEvaluator",
+            "strands_evals.evaluators:ToolSelectionAccuracyEvaluator",
+            "evaluators.turn_efficiency:TurnEfficiencyEvaluator",
+            "evaluators.concise_response:ConciseResponseEvaluator",
         ],
         description="Evaluates github issue resolution agents",
         sop_file="task-implementer.sop.md",
     ),
     "release_notes": EvalConfig(
         evaluators=[
-            ReleaseNotesStructureEvaluator,
-            HelpfulnessEvaluator,
-            ConciseResponseEvaluator,
+            "evaluators.release_notes_structure:ReleaseNotesStructureEvaluator",
+            "evaluators.code_syntax:CodeSyntaxValidityEvaluator",
+            "evaluators.natural_writing:NaturalWritingEvaluator",
+            "strands_evals.evaluators:HelpfulnessEvaluator",
+            "evaluators.concise_response:ConciseResponseEvaluator",
         ],
         description="Evaluates release notes generation",
         sop_file="task-release-notes.sop.md",
     ),
     "reviewer": EvalConfig(
         evaluators=[
-            HelpfulnessEvaluator,
-            GoalSuccessRateEvaluator,
-            ConciseResponseEvaluator,
-            TurnEfficiencyEvaluator,
+            "strands_evals.evaluators:HelpfulnessEvaluator",
+            "strands_evals.evaluators:GoalSuccessRateEvaluator",
+            "evaluators.concise_response:ConciseResponseEvaluator",
+            "evaluators.turn_efficiency:TurnEfficiencyEvaluator",
         ],
         description="Evaluates code review agents",
         sop_file="task-reviewer.sop.md",
     ),
     "implementer": EvalConfig(
         evaluators=[
-            ToolSelectionAccuracyEvaluator,
-            TurnEfficiencyEvaluator,
+            "strands_evals.evaluators:ToolSelectionAccuracyEvaluator",
+            "evaluators.turn_efficiency:TurnEfficiencyEvaluator",
         ],
         description="Evaluates implementation agents",
         sop_file="task-implementer.sop.md",
@@ -69,15 +83,19 @@ EVAL_CONFIGS: dict[str, EvalConfig] = {
 }
 
 
+@functools.lru_cache(maxsize=16)
 def get_eval_config(eval_type: str) -> EvalConfig:
     """Get evaluation config for a given type.
-    
+
+    Results are cached per eval_type, so warm Lambda invocations skip the
+    lookup and evaluator-class resolution entirely.
+
     Args:
         eval_type: The type of evaluation (e.g., "github_issue", "reviewer")
-        
+
     Returns:
         EvalConfig with evaluators and description
-        
+
     Raises:
         ValueError: If eval_type is not recognized
     """
@@ -85,4 +103,5 @@ def get_eval_config(eval_type: str) -> EvalConfig:
     if not config:
         valid_types = list(EVAL_CONFIGS.keys())
         raise ValueError(f"Unknown eval_type: '{eval_type}'. Valid types: {valid_types}")
+    config.evaluators = [_resolve_evaluator(spec) for spec in config.evaluators]
     return config
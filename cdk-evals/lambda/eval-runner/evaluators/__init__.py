@@ -1,13 +1,28 @@
-"""Custom evaluators for agent evaluation."""
-
-from evaluators.concise_response import ConciseResponseEvaluator
-from evaluators.expected_trajectory import ExpectedTrajectoryEvaluator
-from evaluators.release_notes_structure import ReleaseNotesStructureEvaluator
-from evaluators.turn_efficiency import TurnEfficiencyEvaluator
-
-__all__ = [
-    "ConciseResponseEvaluator",
-    "ExpectedTrajectoryEvaluator",
-    "ReleaseNotesStructureEvaluator",
-    "TurnEfficiencyEvaluator",
-]
+"""Custom evaluators for agent evaluation.
+
+Evaluator classes are loaded lazily (PEP 562) so that importing this
+package does not pull in strands/pydantic for evaluators the selected
+eval_type never uses - that import work dominates Lambda cold start.
+"""
+
+import importlib
+
+_LAZY_EVALUATORS = {
+    "CodeSyntaxValidityEvaluator": "evaluators.code_syntax",
+    "ConciseResponseEvaluator": "evaluators.concise_response",
+    "ExpectedTrajectoryEvaluator": "evaluators.expected_trajectory",
+    "NaturalWritingEvaluator": "evaluators.natural_writing",
+    "ReleaseNotesStructureEvaluator": "evaluators.release_notes_structure",
+    "TurnEfficiencyEvaluator": "evaluators.turn_efficiency",
+}
+
+__all__ = list(_LAZY_EVALUATORS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EVALUATORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module_name), name)
+    globals()[name] = obj
+    return obj
@@ -4,6 +4,7 @@ This evaluator uses an LLM judge to rate response conciseness on a scale from
 "Extremely verbose" to "Too brief", with "Appropriately concise" being the ideal.
 """
 
+import asyncio
 from enum import Enum
 
 from pydantic import BaseModel, Field
@@ -12,7 +13,7 @@ from strands.models.model import Model
 from typing_extensions import TypeVar, Union
 
 from strands_evals.types.evaluation import EvaluationData, EvaluationOutput
-from strands_evals.types.trace import EvaluationLevel, TextContent, ToolExecution, TraceLevelInput
+from strands_evals.types.trace import EvaluationLevel, TextContent, TraceLevelInput
 from strands_evals.evaluators.evaluator import Evaluator
 
 InputT = TypeVar("InputT")
@@ -102,36 +103,54 @@ class ConciseResponseEvaluator(Evaluator[InputT, OutputT]):
         self.system_prompt = system_prompt if system_prompt is not None else CONCISENESS_SYSTEM_PROMPT
         self.model = model
         self.pass_threshold = pass_threshold
+        self._agent: Agent | None = None
 
-    def evaluate(self, evaluation_case: EvaluationData[InputT, OutputT]) -> list[EvaluationOutput]:
-        """Evaluate conciseness of the agent's response."""
-        parsed_input = self._get_last_turn(evaluation_case)
-        prompt = self._format_prompt(parsed_input)
-        evaluator_agent = Agent(model=self.model, system_prompt=self.system_prompt, callback_handler=None)
-        rating = evaluator_agent.structured_output(ConcisenessRating, prompt)
+    def _get_agent(self) -> Agent:
+        """Return the judge Agent, constructing it once per evaluator instance."""
+        if self._agent is None:
+            self._agent = Agent(model=self.model, system_prompt=self.system_prompt, callback_handler=None)
+        return self._agent
+
+    def _build_output(self, rating: ConcisenessRating) -> EvaluationOutput:
+        """Convert a judge rating into an EvaluationOutput."""
         normalized_score = self._score_mapping[rating.score]
-        result = EvaluationOutput(
+        return EvaluationOutput(
             score=normalized_score,
             test_pass=normalized_score >= self.pass_threshold,
             reason=rating.reasoning,
             label=rating.score.value,
         )
-        return [result]
+
+    def evaluate(self, evaluation_case: EvaluationData[InputT, OutputT]) -> list[EvaluationOutput]:
+        """Evaluate conciseness of the agent's response."""
+        parsed_input = self._get_last_turn(evaluation_case)
+        prompt = self._format_prompt(parsed_input)
+        evaluator_agent = self._get_agent()
+        rating = evaluator_agent.structured_output(ConcisenessRating, prompt)
+        return [self._build_output(rating)]
 
     async def evaluate_async(self, evaluation_case: EvaluationData[InputT, OutputT]) -> list[EvaluationOutput]:
         """Async evaluation."""
         parsed_input = self._get_last_turn(evaluation_case)
         prompt = self._format_prompt(parsed_input)
-        evaluator_agent = Agent(model=self.model, system_prompt=self.system_prompt, callback_handler=None)
+        evaluator_agent = self._get_agent()
         rating = await evaluator_agent.structured_output_async(ConcisenessRating, prompt)
-        normalized_score = self._score_mapping[rating.score]
-        result = EvaluationOutput(
-            score=normalized_score,
-            test_pass=normalized_score >= self.pass_threshold,
-            reason=rating.reasoning,
-            label=rating.score.value,
+        return [self._build_output(rating)]
+
+    async def evaluate_batch(
+        self, evaluation_cases: list[EvaluationData[InputT, OutputT]]
+    ) -> list[list[EvaluationOutput]]:
+        """Evaluate many cases concurrently against the shared judge agent.
+
+        Fans out one structured_output call per case with asyncio.gather,
+        amortizing network round-trips when a batch targets this evaluator.
+        """
+        prompts = [self._format_prompt(self._get_last_turn(case)) for case in evaluation_cases]
+        evaluator_agent = self._get_agent()
+        ratings = await asyncio.gather(
+            *(evaluator_agent.structured_output_async(ConcisenessRating, prompt) for prompt in prompts)
         )
-        return [result]
+        return [[self._build_output(rating)] for rating in ratings]
 
     def _get_last_turn(self, evaluation_case: EvaluationData[InputT, OutputT]) -> TraceLevelInput:
         """Extract the most recent turn from the conversation for evaluation."""
@@ -163,12 +182,14 @@ class ConciseResponseEvaluator(Evaluator[InputT, OutputT]):
         if parsed_input.session_history:
             history_lines = []
             for msg in parsed_input.session_history:
-                if isinstance(msg, list) and msg and isinstance(msg[0], ToolExecution):
+                if isinstance(msg, list):
+                    continue
+                content = getattr(msg, "content", None)
+                if not content:
                     continue
-                if not isinstance(msg, list) and self._has_text_content(msg):
-                    first_content = msg.content[0]
-                    if isinstance(first_content, TextContent):
-                        history_lines.append(f"{msg.role.value.capitalize()}: {first_content.text}")
+                first_content = content[0]
+                if isinstance(first_content, TextContent):
+                    history_lines.append(f"{msg.role.value.capitalize()}: {first_content.text}")
             history_str = "\n".join(history_lines)
             parts.append(f"# Previous turns:\n{history_str}")
 
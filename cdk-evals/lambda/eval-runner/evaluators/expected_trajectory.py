@@ -50,44 +50,45 @@ class ExpectedTrajectoryEvaluator(Evaluator[Any, Any]):
         expected_tools = set(expected_trajectory) if isinstance(expected_trajectory, list) else set()
         
         # Extract actual tools from Session
-        actual_tools = self._extract_tools_from_trajectory(evaluation_case.actual_trajectory)
-        actual_tools_set = set(actual_tools)
-        actual_tools_count = len(actual_tools)
+        actual_tools_set, actual_tools_count = self._extract_tools(evaluation_case.actual_trajectory)
         
-        # Calculate metrics
+        # Calculate only the metric selected by score_type
         intersection = expected_tools & actual_tools_set
-        
-        # Recall: What % of expected tools were used?
-        recall = len(intersection) / len(expected_tools) if expected_tools else 1.0
-        
-        # Precision: What % of tool calls were expected tools?
-        precision = len(intersection) / len(actual_tools_set) if actual_tools_set else 0.0
-        
-        # F1: Harmonic mean
-        f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
-        
-        # Select score based on score_type
-        score_map = {"f1": f1, "recall": recall, "precision": precision}
-        score = score_map.get(self.score_type, f1)
-        
-        # Build detailed reason
-        missing_tools = expected_tools - actual_tools_set
-        extra_tools = actual_tools_set - expected_tools
-        
-        reason_parts = [
-            f"Expected tools: {sorted(expected_tools)}",
-            f"Actual tools used: {sorted(actual_tools_set)} ({actual_tools_count} total calls)",
-            f"Matching tools: {sorted(intersection)}",
-            f"Missing tools: {sorted(missing_tools)}" if missing_tools else None,
-            f"Unexpected tools: {sorted(extra_tools)}" if extra_tools else None,
-            f"Recall: {recall:.2f} | Precision: {precision:.2f} | F1: {f1:.2f}",
-        ]
-        reason = " | ".join(p for p in reason_parts if p)
-        
+
+        if self.score_type == "recall":
+            # Recall: What % of expected tools were used?
+            score = len(intersection) / len(expected_tools) if expected_tools else 1.0
+        elif self.score_type == "precision":
+            # Precision: What % of tool calls were expected tools?
+            score = len(intersection) / len(actual_tools_set) if actual_tools_set else 0.0
+        else:
+            # F1: Harmonic mean of recall and precision
+            recall = len(intersection) / len(expected_tools) if expected_tools else 1.0
+            precision = len(intersection) / len(actual_tools_set) if actual_tools_set else 0.0
+            score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
+
         # Determine pass/fail and label
         test_pass = score >= self.pass_threshold
         label = "PASS" if test_pass else "FAIL"
-        
+
+        if test_pass:
+            # Passing reasons are rarely inspected - skip the sorted() calls
+            reason = f"{self.score_type}: {score:.2f} ({actual_tools_count} total calls)"
+        else:
+            # Build detailed reason for diagnostics
+            missing_tools = expected_tools - actual_tools_set
+            extra_tools = actual_tools_set - expected_tools
+
+            reason_parts = [
+                f"Expected tools: {sorted(expected_tools)}",
+                f"Actual tools used: {sorted(actual_tools_set)} ({actual_tools_count} total calls)",
+                f"Matching tools: {sorted(intersection)}",
+                f"Missing tools: {sorted(missing_tools)}" if missing_tools else None,
+                f"Unexpected tools: {sorted(extra_tools)}" if extra_tools else None,
+                f"{self.score_type}: {score:.2f}",
+            ]
+            reason = " | ".join(p for p in reason_parts if p)
+
         return [EvaluationOutput(
             score=score,
             test_pass=test_pass,
@@ -99,35 +100,40 @@ class ExpectedTrajectoryEvaluator(Evaluator[Any, Any]):
         """Async evaluation (same as sync since no LLM calls)."""
         return self.evaluate(evaluation_case)
     
-    def _extract_tools_from_trajectory(self, trajectory: Session | list | None) -> list[str]:
-        """Extract tool names from the trajectory.
-        
+    def _extract_tools(self, trajectory: Session | list | None) -> tuple[set[str], int]:
+        """Extract tool names from the trajectory in a single pass.
+
         Args:
             trajectory: Session object or list of spans
-            
+
         Returns:
-            List of tool names (may contain duplicates for multiple calls)
+            Tuple of (unique tool names, total number of tool calls)
         """
         if trajectory is None:
-            return []
-        
+            return set(), 0
+
         if isinstance(trajectory, Session):
-            tool_names = []
-            for trace in trajectory.traces:
-                for span in trace.spans:
-                    if isinstance(span, ToolExecutionSpan):
-                        tool_names.append(span.tool_call.name)
-            return tool_names
-        
+            # Comprehension keeps the walk in tight bytecode; the exact-type
+            # check is cheaper than isinstance and spans are not subclassed.
+            names = [
+                span.tool_call.name
+                for trace in trajectory.traces
+                for span in trace.spans
+                if type(span) is ToolExecutionSpan
+            ]
+            return set(names), len(names)
+
         if isinstance(trajectory, list):
-            # If it's already a list of strings (tool names), return as-is
+            # If it's already a list of strings (tool names), use as-is
             if all(isinstance(item, str) for item in trajectory):
-                return trajectory
+                return set(trajectory), len(trajectory)
             # Otherwise try to extract from spans
-            tool_names = []
+            tool_names = set()
+            call_count = 0
             for item in trajectory:
                 if hasattr(item, 'tool_call') and hasattr(item.tool_call, 'name'):
-                    tool_names.append(item.tool_call.name)
-            return tool_names
-        
-        return []
+                    tool_names.add(item.tool_call.name)
+                    call_count += 1
+            return tool_names, call_count
+
+        return set(), 0
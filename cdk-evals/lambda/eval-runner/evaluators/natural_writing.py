@@ -0,0 +1,161 @@
+"""Evaluator that checks release notes read like natural human writing.
+
+Flags hedging language, AI meta-commentary, and verbose filler phrases
+that make generated release notes feel machine-written.
+"""
+
+import re
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from typing import ClassVar, Optional
+
+from strands_evals.evaluators import Evaluator
+from strands_evals.types import EvaluationData, EvaluationOutput
+
+
+class NaturalWritingEvaluator(Evaluator[str, str]):
+    """
+    Evaluates whether release notes are written in a natural, direct style.
+
+    Checks:
+    - Hedging language ("it seems", "perhaps", "might be")
+    - AI meta-commentary ("i hope this helps", "let me know if")
+    - Verbose filler ("it is important to note", "in order to")
+
+    Pure string matching - no LLM judge. Patterns are matched in a single
+    pass with an Aho-Corasick automaton when the ahocorasick package is
+    available, otherwise with one precompiled alternation regex per
+    category.
+    """
+
+    HEDGING_PATTERNS = [
+        "it seems", "it appears", "perhaps", "possibly", "might be",
+        "could potentially", "arguably", "somewhat", "to some extent",
+        "generally speaking", "in most cases", "more or less",
+        "sort of", "kind of", "presumably",
+    ]
+    META_PATTERNS = [
+        "as an ai", "i hope this helps", "let me know if", "feel free to",
+        "i'd be happy to", "great question", "here is the", "here are the",
+        "in this response", "as requested", "i have generated", "below is",
+        "please note that", "without further ado",
+    ]
+    VERBOSE_PATTERNS = [
+        "it is important to note", "it is worth noting", "it should be noted",
+        "in order to", "due to the fact that", "at this point in time",
+        "for the purpose of", "in the event that", "a wide variety of",
+        "each and every", "first and foremost", "last but not least",
+        "needless to say", "as a matter of fact",
+    ]
+
+    # Fallback matchers: one pass per category instead of one per pattern
+    _HEDGING_RE = re.compile("|".join(re.escape(p) for p in HEDGING_PATTERNS))
+    _META_RE = re.compile("|".join(re.escape(p) for p in META_PATTERNS))
+    _VERBOSE_RE = re.compile("|".join(re.escape(p) for p in VERBOSE_PATTERNS))
+
+    # Penalty per match, by category
+    _CATEGORY_WEIGHTS = {
+        "hedging": 0.05,
+        "meta": 0.10,
+        "verbose": 0.05,
+    }
+
+    # Built once per class, not per instance - the eval runner may
+    # reconstruct evaluators per case
+    _automaton: ClassVar[Optional["ahocorasick.Automaton"]] = None
+
+    def __init__(self, threshold: float = 0.7):
+        """
+        Initialize the evaluator.
+
+        Args:
+            threshold: Score threshold for passing (default 0.7)
+        """
+        super().__init__()
+        if ahocorasick is not None and NaturalWritingEvaluator._automaton is None:
+            NaturalWritingEvaluator._automaton = self._build_automaton()
+        self.threshold = threshold
+
+    @classmethod
+    def _build_automaton(cls) -> "ahocorasick.Automaton":
+        """Build the Aho-Corasick automaton over all pattern categories."""
+        automaton = ahocorasick.Automaton()
+        categories = [
+            ("hedging", cls.HEDGING_PATTERNS),
+            ("meta", cls.META_PATTERNS),
+            ("verbose", cls.VERBOSE_PATTERNS),
+        ]
+        for category, patterns in categories:
+            for pattern in patterns:
+                automaton.add_word(pattern, category)
+        automaton.make_automaton()
+        return automaton
+
+    def _count_all_matches(self, text_lower: str) -> dict[str, int]:
+        """Count matches per category. Expects already-lowercased text."""
+        if self._automaton is not None:
+            counts = {"hedging": 0, "meta": 0, "verbose": 0}
+            for _, category in self._automaton.iter(text_lower):
+                counts[category] += 1
+            return counts
+        return {
+            "hedging": len(self._HEDGING_RE.findall(text_lower)),
+            "meta": len(self._META_RE.findall(text_lower)),
+            "verbose": len(self._VERBOSE_RE.findall(text_lower)),
+        }
+
+    def evaluate(
+        self, evaluation_case: EvaluationData[str, str]
+    ) -> list[EvaluationOutput]:
+        """
+        Evaluate the writing style of release notes.
+
+        Args:
+            evaluation_case: The evaluation data containing actual_output
+
+        Returns:
+            List containing single EvaluationOutput
+        """
+        output = evaluation_case.actual_output or ""
+
+        if not output:
+            return [EvaluationOutput(
+                score=0.0,
+                test_pass=False,
+                reason="No output to evaluate"
+            )]
+
+        # Lowercase once - the pattern lists are all lowercase
+        counts = self._count_all_matches(output.lower())
+
+        penalty = sum(
+            counts[category] * weight
+            for category, weight in self._CATEGORY_WEIGHTS.items()
+        )
+        final_score = max(0.0, 1.0 - penalty)
+
+        reason = (
+            f"Hedging: {counts['hedging']} | "
+            f"Meta-commentary: {counts['meta']} | "
+            f"Verbose filler: {counts['verbose']}"
+        )
+
+        return [EvaluationOutput(
+            score=final_score,
+            test_pass=final_score >= self.threshold,
+            reason=reason
+        )]
+
+    async def evaluate_async(
+        self, evaluation_case: EvaluationData[str, str]
+    ) -> list[EvaluationOutput]:
+        """Async evaluation - delegates to sync since matching is CPU-only.
+
+        Present so the runner can asyncio.gather this evaluator alongside
+        LLM-backed ones and overlap their network latency.
+        """
+        return self.evaluate(evaluation_case)
@@ -88,9 +88,9 @@ class TurnEfficiencyEvaluator(Evaluator[InputT, OutputT]):
         Each AgentInvocationSpan represents one turn of agent invocation
         (user prompt -> agent response).
         """
-        count = 0
-        for trace in session.traces:
-            for span in trace.spans:
-                if isinstance(span, AgentInvocationSpan):
-                    count += 1
-        return count
+        return sum(
+            1
+            for trace in session.traces
+            for span in trace.spans
+            if isinstance(span, AgentInvocationSpan)
+        )
@@ -14,20 +14,39 @@ See eval_configs.py for the mapping of eval_type to evaluators.
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Set up environment from Secrets Manager before imports
+_sm_client = None
+_secrets_cache = None
+
+
 def get_langfuse_secrets():
-    """Fetch Langfuse credentials from Secrets Manager."""
-    client = boto3.client("secretsmanager", region_name="us-east-1")
-    secret_value = client.get_secret_value(SecretId="strands-evals/langfuse")
-    return json.loads(secret_value["SecretString"])
+    """Fetch Langfuse credentials from Secrets Manager.
+
+    The client and parsed secret are cached at module level so warm
+    containers (and any re-entrant call) skip the client build and the
+    network round-trip.
+    """
+    global _sm_client, _secrets_cache
+    if _secrets_cache is not None:
+        return _secrets_cache
+    if _sm_client is None:
+        _sm_client = boto3.client("secretsmanager", region_name="us-east-1")
+    secret_value = _sm_client.get_secret_value(SecretId="strands-evals/langfuse")
+    _secrets_cache = json.loads(secret_value["SecretString"])
+    return _secrets_cache
 
 
 def setup_environment():
     """Set up environment variables from Secrets Manager."""
+    if "LANGFUSE_HOST" in os.environ:
+        return
     secrets = get_langfuse_secrets()
     os.environ["LANGFUSE_SECRET_KEY"] = secrets["LANGFUSE_SECRET_KEY"]
     os.environ["LANGFUSE_PUBLIC_KEY"] = secrets["LANGFUSE_PUBLIC_KEY"]
@@ -37,26 +56,52 @@ def setup_environment():
 # Initialize environment on cold start
 setup_environment()
 
-# Now import evaluation modules after environment is set
-from strands_evals import Case, Experiment
-from strands_evals.providers import LangfuseProvider
-
-from s3_export import export_reports_to_s3, export_insights_to_s3
+# Import lightweight local modules after environment is set; the heavy
+# strands_evals imports are deferred into run_session_evaluation so cold
+# start does not pay for them before a record actually needs them
+from s3_export import export_reports_to_s3, export_insights_to_s3, flush_invalidations
 from eval_configs import get_eval_config
 from insights_generator import generate_insights
 
 
+_provider = None
+
+
+def _get_provider():
+    """Return the shared LangfuseProvider, built on first use.
+
+    Reusing one provider keeps its HTTP connection pool (and TLS sessions)
+    alive across records in the same warm container.
+    """
+    global _provider
+    if _provider is None:
+        from strands_evals.providers import LangfuseProvider
+        _provider = LangfuseProvider()
+    return _provider
+
+
 def run_session_evaluation(session_id: str, eval_type: str):
     """Run evaluation on a single session by ID."""
     logger.info(f"Running session evaluation: session_id={session_id}, eval_type={eval_type}")
-    
-    provider = LangfuseProvider()
-    try:
-        eval_data = provider.get_evaluation_data(session_id)
-    except Exception as e:
-        logger.error(f"Error fetching session: {e}")
-        raise
-    
+
+    # First call pays the import cost; afterwards sys.modules makes this free
+    from strands_evals import Case, Experiment
+
+    provider = _get_provider()
+
+    # Start the Langfuse fetch in the background and resolve the eval config
+    # (lazy evaluator imports, instantiation) while the network call is in
+    # flight - the two have no data dependency.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fetch_future = executor.submit(provider.get_evaluation_data, session_id)
+        config = get_eval_config(eval_type)
+        evaluators = [e() for e in config.evaluators]
+        try:
+            eval_data = fetch_future.result()
+        except Exception as e:
+            logger.error(f"Error fetching session: {e}")
+            raise
+
     case_name = f"Session {session_id}"
     case_data = {
         "name": case_name,
@@ -70,9 +115,7 @@ def run_session_evaluation(session_id: str, eval_type: str):
         },
     }
     
-    # Create experiment with evaluators for this eval_type
-    config = get_eval_config(eval_type)
-    evaluators = [e() for e in config.evaluators]
+    # Create experiment with the evaluators resolved above
     experiment = Experiment(cases=[Case(**case_data)], evaluators=evaluators)
     
     logger.info(f"Evaluators: {[e.get_type_name() for e in experiment.evaluators]}")
@@ -108,41 +151,53 @@ def run_session_evaluation(session_id: str, eval_type: str):
     }
 
 
+def _process_record(record):
+    """Process a single SQS record, returning its result or error dict."""
+    try:
+        # Parse SQS message body
+        body = orjson.loads(record["body"])
+        session_id = body.get("session_id")
+        eval_type = body.get("eval_type")
+
+        if not session_id:
+            return {
+                "error": "Missing session_id",
+                "message": body,
+            }
+
+        # Run evaluation
+        return run_session_evaluation(session_id, eval_type)
+
+    except Exception as e:
+        logger.exception(f"Error processing record: {e}")
+        return {
+            "error": str(e),
+            "record": record,
+        }
+
+
 def handler(event, context):
     """Lambda handler for SQS-triggered evaluations."""
-    logger.info(f"Received event: {json.dumps(event)}")
-    
+    records = event.get("Records", [])
+    # Don't json.dumps the whole event - bodies can be large and the
+    # serialization cost (and CloudWatch bytes) buys nothing
+    logger.info(f"Received {len(records)} records: {[r.get('messageId') for r in records]}")
     results = []
-    
-    for record in event.get("Records", []):
-        try:
-            # Parse SQS message body
-            body = json.loads(record["body"])
-            session_id = body.get("session_id")
-            eval_type = body.get("eval_type")
-            
-            if not session_id:
-                results.append({
-                    "error": "Missing session_id",
-                    "message": body,
-                })
-                continue
-
-            # Run evaluation
-            result = run_session_evaluation(session_id, eval_type)
-            results.append(result)
-            
-        except Exception as e:
-            logger.exception(f"Error processing record: {e}")
-            results.append({
-                "error": str(e),
-                "record": record,
-            })
-    
+
+    if records:
+        # Records are independent and I/O-bound (Langfuse fetch, LLM judges,
+        # S3 export), so process them concurrently; map() preserves order.
+        with ThreadPoolExecutor(max_workers=min(10, len(records))) as executor:
+            results = list(executor.map(_process_record, records))
+
+        # All exports in this invocation share one CloudFront invalidation;
+        # flush before returning since a frozen container won't run timers
+        flush_invalidations()
+
     return {
         "statusCode": 200,
-        "body": json.dumps({
+        "body": orjson.dumps({
             "message": "Evaluation complete",
             "results": results,
-        })
+        }).decode()
     }
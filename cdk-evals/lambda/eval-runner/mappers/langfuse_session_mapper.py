@@ -1,12 +1,19 @@
 """Langfuse session mapper for fetching traces and converting to Session format."""
 
+import asyncio
 import json
 import logging
 import os
+import pickle
+import random
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, ClassVar
 
+import httpx
 from langfuse import Langfuse
 from strands_evals.types.trace import (
     AgentInvocationSpan,
@@ -26,8 +33,71 @@ from strands_evals.types.trace import (
 
 from .session_mapper import SessionMapper
 
+# Bedrock "message" payloads are parsed once per assistant output - the hot
+# JSON path in this module. Prefer orjson (Rust, ~2-5x faster on typical LLM
+# payloads) and fall back to stdlib json when it isn't installed.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Lambda's ephemeral /tmp survives across invocations of a warm container
+# and, unlike the in-memory cache, across handler reloads
+_DISK_CACHE_PATH = "/tmp/langfuse_session_cache.db"
+
+# Sentinels for sorting spans/traces that lack timestamps
+_DMIN = datetime.min
+_DMIN_UTC = datetime.min.replace(tzinfo=timezone.utc)
+
+# Batched ingestion stamps many spans with identical timestamps, so string
+# parses repeat; keep a small bounded memo (insertion order doubles as a
+# cheap eviction order)
+_dt_cache: dict[str, datetime] = {}
+_DT_CACHE_MAX = 1024
+
+
+def _constructor(cls):
+    """Bind a validation-bypassing constructor for a pydantic model.
+
+    The mapper only feeds these types values it has already shape-checked
+    against the known Langfuse payload formats, so re-validating every field
+    reflectively on construction buys nothing and dominates conversion CPU
+    for large sessions. Non-pydantic classes (and pydantic v1, which names
+    the method differently) fall back to the normal constructor.
+    """
+    return getattr(cls, "model_construct", cls)
+
+
+_SpanInfo = _constructor(SpanInfo)
+_InferenceSpan = _constructor(InferenceSpan)
+_AgentInvocationSpan = _constructor(AgentInvocationSpan)
+_TextContent = _constructor(TextContent)
+_UserMessage = _constructor(UserMessage)
+_AssistantMessage = _constructor(AssistantMessage)
+_ToolCallContent = _constructor(ToolCallContent)
+_ToolResultContent = _constructor(ToolResultContent)
+_ToolCall = _constructor(ToolCall)
+_ToolResult = _constructor(ToolResult)
+_ToolExecutionSpan = _constructor(ToolExecutionSpan)
+
+
+def _to_dt(value: Any) -> datetime:
+    """Coerce a Langfuse timestamp to datetime, memoizing string parses."""
+    if isinstance(value, datetime):
+        return value
+    key = str(value)
+    parsed = _dt_cache.get(key)
+    if parsed is None:
+        parsed = datetime.fromisoformat(key)
+        if len(_dt_cache) >= _DT_CACHE_MAX:
+            del _dt_cache[next(iter(_dt_cache))]
+        _dt_cache[key] = parsed
+    return parsed
+
 
 class LangfuseSessionMapper(SessionMapper):
     """Fetches traces from Langfuse and converts to Session format for evaluation.
@@ -37,11 +107,28 @@ class LangfuseSessionMapper(SessionMapper):
     2. Converting Langfuse observations to strands_evals Session/Trace format
     """
 
+    # One pooled HTTP client shared by every mapper instance so the TLS
+    # handshake is paid once per container, not once per API call
+    _http_client: ClassVar[httpx.Client | None] = None
+
+    @classmethod
+    def _shared_http_client(cls) -> httpx.Client:
+        if cls._http_client is None:
+            cls._http_client = httpx.Client(
+                timeout=30,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+        return cls._http_client
+
     def __init__(
         self,
         public_key: str | None = None,
         secret_key: str | None = None,
         host: str | None = None,
+        cache_ttl: float = 300.0,
+        disk_cache: bool = True,
+        disk_cache_ttl: float = 3600.0,
+        include_detail_spans: bool = False,
     ):
         """Initialize the Langfuse session mapper.
 
@@ -49,120 +136,463 @@ class LangfuseSessionMapper(SessionMapper):
             public_key: Langfuse public key (defaults to LANGFUSE_PUBLIC_KEY env var)
             secret_key: Langfuse secret key (defaults to LANGFUSE_SECRET_KEY env var)
             host: Langfuse host URL (defaults to LANGFUSE_HOST env var or cloud.langfuse.com)
+            cache_ttl: Seconds a converted Session stays cached in memory (default 300)
+            disk_cache: Also persist converted Sessions to /tmp sqlite so they
+                survive handler reloads in a warm Lambda container
+            disk_cache_ttl: Seconds a disk-cached Session stays valid (default 3600)
+            include_detail_spans: Also emit the per-observation Inference/
+                ToolExecution spans alongside each trace's AgentInvocationSpan.
+                Most evaluators only read the agent span; pass True for
+                evaluators that inspect individual inference or tool spans
+                (e.g. trajectory or turn-level analysis).
         """
-        self.client = Langfuse(
+        client_kwargs = dict(
             public_key=public_key or os.environ.get("LANGFUSE_PUBLIC_KEY"),
             secret_key=secret_key or os.environ.get("LANGFUSE_SECRET_KEY"),
             host=host or os.environ.get("LANGFUSE_HOST", "https://cloud.langfuse.com"),
             timeout=30,  # Increase timeout for API calls
         )
+        try:
+            # Reuse the shared connection pool across mapper instances; the
+            # SDK otherwise builds a fresh httpx.Client per Langfuse object
+            self.client = Langfuse(httpx_client=self._shared_http_client(), **client_kwargs)
+        except TypeError:
+            # Older SDK without the httpx_client kwarg - its internal client
+            # still pools connections within this instance
+            self.client = Langfuse(**client_kwargs)
+        # Re-running evaluators over the same session (e.g. iterating on a new
+        # judge) is common; cache converted Sessions so repeat fetches skip
+        # both the Langfuse roundtrips and the observation conversion work.
+        self.include_detail_spans = include_detail_spans
+        self.cache_ttl = cache_ttl
+        self._session_cache: dict[tuple, tuple[float, Session]] = {}
+        # Second cache tier on disk: cheap to read back (one sqlite row +
+        # unpickle) compared to re-fetching and re-converting from Langfuse.
+        # Keys are namespaced by host so mappers pointed at different
+        # Langfuse deployments never collide.
+        self.disk_cache_ttl = disk_cache_ttl
+        self._disk_cache_enabled = disk_cache
+        self._disk_namespace = host or os.environ.get("LANGFUSE_HOST", "https://cloud.langfuse.com")
+        self._disk_conn: sqlite3.Connection | None = None
+        self._disk_lock = threading.Lock()
+        # A given Langfuse backend emits one output format consistently
+        # (e.g. always "message" for Bedrock), so remember which key hit
+        # last and probe it first instead of scanning all candidates.
+        # Not thread-safe, but a stale value only costs the full probe.
+        self._last_output_key: str | None = None
+
+    def clear_cache(self) -> None:
+        """Drop all cached sessions, in memory and on disk (useful for test isolation)."""
+        self._session_cache.clear()
+        if self._disk_cache_enabled:
+            try:
+                with self._disk_lock:
+                    self._disk_connect().execute("DELETE FROM sessions")
+                    self._disk_conn.commit()
+            except sqlite3.Error as e:
+                logger.debug("Disk cache clear failed: %s", e)
+
+    def _disk_connect(self) -> sqlite3.Connection:
+        """Open (once) the /tmp sqlite connection backing the disk cache."""
+        if self._disk_conn is None:
+            # check_same_thread=False: access is serialized by _disk_lock,
+            # and get_session may run on different executor threads
+            conn = sqlite3.connect(_DISK_CACHE_PATH, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(key TEXT PRIMARY KEY, fetched_at REAL, data BLOB)"
+            )
+            conn.commit()
+            self._disk_conn = conn
+        return self._disk_conn
+
+    def _disk_key(self, key: tuple) -> str:
+        # The detail-span flag changes what a converted Session contains, so
+        # mappers with different settings must not share disk entries
+        detail = "detail" if self.include_detail_spans else "agent"
+        return ":".join((self._disk_namespace, detail, *map(str, key)))
+
+    def _disk_get(self, key: tuple) -> Session | None:
+        """Return a Session from the disk cache, or None on miss/expiry/error.
+
+        Cache failures are never fatal - the caller just falls through to a
+        normal fetch.
+        """
+        if not self._disk_cache_enabled:
+            return None
+        try:
+            with self._disk_lock:
+                conn = self._disk_connect()
+                row = conn.execute(
+                    "SELECT fetched_at, data FROM sessions WHERE key = ?",
+                    (self._disk_key(key),),
+                ).fetchone()
+                if row is None:
+                    return None
+                fetched_at, blob = row
+                if time.time() - fetched_at > self.disk_cache_ttl:
+                    conn.execute("DELETE FROM sessions WHERE key = ?", (self._disk_key(key),))
+                    conn.commit()
+                    return None
+            return pickle.loads(blob)
+        except (sqlite3.Error, pickle.PickleError, AttributeError) as e:
+            logger.debug("Disk cache read failed: %s", e)
+            return None
+
+    def _disk_put(self, key: tuple, session: Session) -> None:
+        if not self._disk_cache_enabled:
+            return
+        try:
+            blob = pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._disk_lock:
+                conn = self._disk_connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions (key, fetched_at, data) VALUES (?, ?, ?)",
+                    (self._disk_key(key), time.time(), blob),
+                )
+                conn.commit()
+        except (sqlite3.Error, pickle.PickleError) as e:
+            logger.debug("Disk cache write failed: %s", e)
+
+    def _cache_get(self, key: tuple) -> Session | None:
+        """Return a cached Session if present and not expired."""
+        entry = self._session_cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, session = entry
+        if time.monotonic() - fetched_at > self.cache_ttl:
+            del self._session_cache[key]
+            return None
+        return session
+
+    def _cache_put(self, key: tuple, session: Session) -> None:
+        self._session_cache[key] = (time.monotonic(), session)
 
     def get_session(
         self,
         session_id: str,
         limit: int = 100,
-        max_retries: int = 6,
-        initial_delay: float = 2.0,
+        max_retries: int = 12,
+        initial_delay: float = 0.2,
+        cache: bool = True,
     ) -> Session:
         """Fetch traces by session_id and convert to Session format.
 
-        Uses polling with exponential backoff to handle Langfuse ingestion latency.
-        Traces may not be immediately available after being sent via OTLP.
+        Uses polling with jittered exponential backoff to handle Langfuse
+        ingestion latency. Traces may not be immediately available after being
+        sent via OTLP. The first probe fires almost immediately so the common
+        case (traces already ingested) returns in well under a second, and the
+        jitter desynchronizes retries across concurrent Lambda invocations so
+        they don't hammer the Langfuse API in lockstep.
 
         Args:
             session_id: The session.id used when creating the agent traces
             limit: Maximum number of traces to fetch
-            max_retries: Maximum number of retry attempts (default 6 = ~2 min total)
-            initial_delay: Initial delay in seconds between retries (doubles each retry)
+            max_retries: Maximum number of retry attempts (default 12 = ~2 min total)
+            initial_delay: Initial delay in seconds between retries (doubles each
+                retry, capped at 15s, jittered +/-50%)
+            cache: Reuse a previously converted Session for this
+                (session_id, limit) if fetched within cache_ttl seconds
 
         Returns:
             Session object with all traces for the given session_id
         """
+        cache_key = ("session", session_id, limit)
+        if cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Session cache hit for session_id=%s", session_id)
+                return cached
+            cached = self._disk_get(cache_key)
+            if cached is not None:
+                logger.debug("Disk cache hit for session_id=%s", session_id)
+                self._cache_put(cache_key, cached)
+                return cached
+
         delay = initial_delay
 
         for attempt in range(max_retries + 1):
-            logger.debug(f"Fetching traces for session_id={session_id} (attempt {attempt + 1}/{max_retries + 1})")
-
-            traces_response = self.client.api.trace.list(
-                session_id=session_id,
-                limit=limit,
-            )
+            logger.debug("Fetching traces for session_id=%s (attempt %d/%d)", session_id, attempt + 1, max_retries + 1)
 
-            logger.debug(f"Langfuse API returned {len(traces_response.data)} traces")
-
-            if traces_response.data:
+            try:
+                traces_response = self.client.api.trace.list(
+                    session_id=session_id,
+                    limit=limit,
+                )
+            except Exception as e:
+                # Rate limited - back off harder than the normal schedule so
+                # the fleet sheds load, then retry like any other empty poll
+                if getattr(e, "status_code", None) == 429 and attempt < max_retries:
+                    delay = min(delay * 4, 15.0)
+                    logger.debug("Langfuse rate limit (429), backing off %.1fs...", delay)
+                    time.sleep(random.uniform(0.5 * delay, 1.5 * delay))
+                    continue
+                raise
+
+            logger.debug("Langfuse API returned %d traces", len(traces_response.data))
+
+            if traces_response.data and self._observations_pending(traces_response.data):
+                # Every listed trace reports zero observations - ingestion
+                # hasn't caught up, so the per-trace fetches would all come
+                # back empty. Go straight to the backoff instead of burning
+                # N round-trips to find that out.
+                logger.debug("Traces exist but report no observations yet; skipping conversion")
+            elif traces_response.data:
                 # Traces found - convert and check for spans
-                for i, trace_data in enumerate(traces_response.data):
-                    logger.debug(f"  Trace {i}: id={trace_data.id}, session_id={trace_data.session_id}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, trace_data in enumerate(traces_response.data):
+                        logger.debug("  Trace %d: id=%s, session_id=%s", i, trace_data.id, trace_data.session_id)
+
+                # Each conversion issues a blocking observations fetch, so for
+                # N traces a sequential loop costs N round-trips back to back.
+                # The fetches are independent - run them concurrently.
+                workers = min(8, len(traces_response.data))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    converted = list(executor.map(
+                        lambda td: self._convert_trace(td, session_id),
+                        traces_response.data,
+                    ))
 
                 traces: list[Trace] = []
-                for trace_data in traces_response.data:
-                    trace = self._convert_trace(trace_data, session_id)
-                    logger.debug(f"Converted trace {trace_data.id}: {len(trace.spans)} spans")
+                for trace_data, trace in zip(traces_response.data, converted):
+                    logger.debug("Converted trace %s: %d spans", trace_data.id, len(trace.spans))
                     if trace.spans:
                         traces.append(trace)
 
                 # If we have traces with spans, sort chronologically and return
                 if traces:
-                    # Sort traces by earliest span start_time (oldest first)
-                    traces.sort(
-                        key=lambda t: min(
-                            (s.span_info.start_time for s in t.spans),
-                            default=datetime.min.replace(tzinfo=timezone.utc)
-                        )
-                    )
-                    logger.debug(f"Final result: {len(traces)} traces with spans (sorted chronologically)")
-                    return Session(traces=traces, session_id=session_id)
+                    # Sort traces by earliest span start_time (oldest first).
+                    # Extract the keys once into a parallel list rather than
+                    # computing the min inside a sort-key lambda.
+                    min_starts = [
+                        min((s.span_info.start_time for s in t.spans), default=_DMIN_UTC)
+                        for t in traces
+                    ]
+                    order = sorted(range(len(traces)), key=min_starts.__getitem__)
+                    traces = [traces[i] for i in order]
+                    logger.debug("Final result: %d traces with spans (sorted chronologically)", len(traces))
+                    session = Session(traces=traces, session_id=session_id)
+                    self._cache_put(cache_key, session)
+                    self._disk_put(cache_key, session)
+                    return session
 
                 # Traces found but no spans yet - observations still ingesting
-                logger.debug(f"Traces found but no spans yet, observations may still be ingesting")
+                logger.debug("Traces found but no spans yet, observations may still be ingesting")
 
             # No usable traces found - retry with backoff if attempts remain
             if attempt < max_retries:
                 reason = "no traces" if not traces_response.data else "traces have no spans"
-                logger.debug(f"Retry: {reason}, waiting {delay:.1f}s...")
-                time.sleep(delay)
-                delay = min(delay * 2, 30.0)  # Cap at 30 seconds
+                logger.debug("Retry: %s, waiting ~%.1fs...", reason, delay)
+                # Jitter the sleep so concurrent invocations polling the same
+                # backend don't retry in synchronized waves
+                time.sleep(random.uniform(0.5 * delay, 1.5 * delay))
+                delay = min(delay * 2, 15.0)  # Cap at 15 seconds
 
         # Max retries exhausted
-        logger.warning(f"No traces with spans found for session_id={session_id} after {max_retries + 1} attempts")
+        logger.warning("No traces with spans found for session_id=%s after %d attempts", session_id, max_retries + 1)
+        return Session(traces=[], session_id=session_id)
+
+    async def aget_session(
+        self,
+        session_id: str,
+        limit: int = 100,
+        max_retries: int = 12,
+        initial_delay: float = 0.2,
+        cache: bool = True,
+    ) -> Session:
+        """Async variant of get_session for callers already running an event loop.
+
+        Polling sleeps are awaited (so a timeout wrapping this coroutine
+        cancels cleanly mid-backoff instead of blocking a thread), and the
+        per-trace conversions fan out with asyncio.gather. The blocking
+        Langfuse SDK calls themselves are offloaded via asyncio.to_thread,
+        which keeps this a single code path with get_session rather than a
+        parallel REST client reimplementation.
+
+        Args mirror get_session.
+        """
+        cache_key = ("session", session_id, limit)
+        if cache:
+            cached = self._cache_get(cache_key)
+            if cached is None:
+                cached = self._disk_get(cache_key)
+            if cached is not None:
+                logger.debug("Session cache hit for session_id=%s", session_id)
+                return cached
+
+        delay = initial_delay
+
+        for attempt in range(max_retries + 1):
+            logger.debug("Fetching traces for session_id=%s (attempt %d/%d)", session_id, attempt + 1, max_retries + 1)
+
+            try:
+                traces_response = await asyncio.to_thread(
+                    self.client.api.trace.list, session_id=session_id, limit=limit
+                )
+            except Exception as e:
+                if getattr(e, "status_code", None) == 429 and attempt < max_retries:
+                    delay = min(delay * 4, 15.0)
+                    logger.debug("Langfuse rate limit (429), backing off %.1fs...", delay)
+                    await asyncio.sleep(random.uniform(0.5 * delay, 1.5 * delay))
+                    continue
+                raise
+
+            if traces_response.data and not self._observations_pending(traces_response.data):
+                converted = await asyncio.gather(
+                    *(
+                        asyncio.to_thread(self._convert_trace, trace_data, session_id)
+                        for trace_data in traces_response.data
+                    )
+                )
+                traces = [trace for trace in converted if trace.spans]
+                if traces:
+                    min_starts = [
+                        min((s.span_info.start_time for s in t.spans), default=_DMIN_UTC)
+                        for t in traces
+                    ]
+                    order = sorted(range(len(traces)), key=min_starts.__getitem__)
+                    traces = [traces[i] for i in order]
+                    session = Session(traces=traces, session_id=session_id)
+                    self._cache_put(cache_key, session)
+                    self._disk_put(cache_key, session)
+                    return session
+
+            if attempt < max_retries:
+                await asyncio.sleep(random.uniform(0.5 * delay, 1.5 * delay))
+                delay = min(delay * 2, 15.0)
+
+        logger.warning("No traces with spans found for session_id=%s after %d attempts", session_id, max_retries + 1)
         return Session(traces=[], session_id=session_id)
 
-    def get_session_by_trace_id(self, trace_id: str) -> Session:
+    def get_sessions(
+        self,
+        session_ids: list[str],
+        limit: int = 100,
+        cache: bool = True,
+    ) -> dict[str, Session]:
+        """Fetch several sessions concurrently.
+
+        Each get_session spends most of its time waiting on Langfuse (and on
+        the ingestion backoff), so a batch fetched serially pays the full
+        latency per session. Fanning out over a thread pool overlaps the
+        waits, and every fetched Session lands in both cache tiers so
+        follow-up single-session calls are free.
+
+        Args:
+            session_ids: Session identifiers to fetch (duplicates are fetched once)
+            limit: Maximum number of traces to fetch per session
+            cache: Reuse/populate the session caches (see get_session)
+
+        Returns:
+            Dict mapping each session_id to its Session
+        """
+        unique_ids = list(dict.fromkeys(session_ids))
+        if not unique_ids:
+            return {}
+        workers = min(8, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sessions = executor.map(
+                lambda sid: self.get_session(sid, limit=limit, cache=cache),
+                unique_ids,
+            )
+            return dict(zip(unique_ids, sessions))
+
+    @staticmethod
+    def _observations_pending(trace_list: list) -> bool:
+        """True when every listed trace reports zero observations.
+
+        Some Langfuse API versions include per-trace observation IDs in the
+        list response. When the field is exposed and all traces show none,
+        conversion is guaranteed to produce empty traces. If any trace omits
+        the field we can't tell, so assume observations may exist.
+        """
+        counts = [getattr(td, "observations", None) for td in trace_list]
+        if any(c is None for c in counts):
+            return False
+        return not any(counts)
+
+    def get_session_by_trace_id(self, trace_id: str, cache: bool = True) -> Session:
         """Fetch a single trace by ID and convert to Session format.
 
         Args:
             trace_id: The Langfuse trace ID
+            cache: Reuse a previously converted Session for this trace_id
+                if fetched within cache_ttl seconds
 
         Returns:
             Session object containing the single trace
         """
+        cache_key = ("trace", trace_id)
+        if cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Session cache hit for trace_id=%s", trace_id)
+                return cached
+            cached = self._disk_get(cache_key)
+            if cached is not None:
+                logger.debug("Disk cache hit for trace_id=%s", trace_id)
+                self._cache_put(cache_key, cached)
+                return cached
+
         trace_data = self.client.api.trace.get(trace_id)
         session_id = trace_data.session_id or trace_id
 
         trace = self._convert_trace(trace_data, session_id)
-        return Session(traces=[trace] if trace.spans else [], session_id=session_id)
-
-    def _convert_trace(self, trace_data: Any, session_id: str) -> Trace:
+        session = Session(traces=[trace] if trace.spans else [], session_id=session_id)
+        if trace.spans:
+            # Only cache sessions with content - an empty result usually means
+            # ingestion hasn't finished, and callers will want to retry
+            self._cache_put(cache_key, session)
+            self._disk_put(cache_key, session)
+        return session
+
+    def _fetch_observations(self, trace_data: Any, max_observations: int) -> list:
+        """Return all observations for a trace, up to max_observations.
+
+        The single-trace endpoint (trace.get) already returns observations
+        inline; reuse those instead of re-fetching. Otherwise page through
+        observations.get_many - the previous single limit=100 call silently
+        truncated long multi-turn traces.
+        """
+        inline = getattr(trace_data, "observations", None)
+        if inline and getattr(inline[0], "type", None) is not None:
+            return list(inline[:max_observations])
+
+        collected: list = []
+        page = 1
+        while len(collected) < max_observations:
+            response = self.client.api.observations.get_many(
+                trace_id=trace_data.id,
+                limit=min(100, max_observations - len(collected)),
+                page=page,
+            )
+            if not response.data:
+                break
+            collected.extend(response.data)
+            if len(response.data) < 100:
+                break
+            page += 1
+        return collected
+
+    def _convert_trace(self, trace_data: Any, session_id: str, max_observations: int = 500) -> Trace:
         """Convert a Langfuse trace to strands_evals Trace format.
-        
+
         Creates a single AgentInvocationSpan per trace, with session_history
         populated from GENERATION observations. This matches what strands_evals
         evaluators expect.
         """
         trace_id = trace_data.id
 
-        # Get all observations for this trace
-        observations = self.client.api.observations.get_many(
-            trace_id=trace_id,
-            limit=100,
-        )
+        observations_data = self._fetch_observations(trace_data, max_observations)
 
-        # Sort observations by start_time to maintain conversation order
-        sorted_obs = sorted(
-            observations.data,
-            key=lambda o: getattr(o, "start_time", datetime.min) or datetime.min,
+        # Sort observations by start_time to maintain conversation order.
+        # Decorate with (key, original_index) pairs instead of a sort-key
+        # lambda - no per-element function call, and the index tiebreak keeps
+        # the sort from ever comparing observation objects themselves.
+        keyed = sorted(
+            ((o.start_time or _DMIN, i) for i, o in enumerate(observations_data))
         )
+        sorted_obs = [observations_data[i] for _, i in keyed]
 
         # Collect inference spans and tool spans
         inference_spans: list[InferenceSpan] = []
@@ -172,101 +602,131 @@ class LangfuseSessionMapper(SessionMapper):
         user_prompt = ""
         agent_response = ""
 
-        for obs in sorted_obs:
+        # Pre-bind the converters once - this loop runs per observation, and
+        # repeated self.* lookups plus defensive getattr calls on known SDK
+        # fields add up over hundreds of spans
+        _create_span_info = self._create_span_info
+        _to_tool = self._convert_to_tool_execution_span
+
+        # The agent response comes from the final generation, so identify it
+        # up front instead of overwriting agent_response on every generation
+        last_gen_idx = -1
+        for i, obs in enumerate(sorted_obs):
+            if obs.type == "GENERATION":
+                last_gen_idx = i
+
+        for i, obs in enumerate(sorted_obs):
             try:
-                obs_type = getattr(obs, "type", None)
-                obs_name = getattr(obs, "name", "")
-                
-                # GENERATION = LLM inference call
+                obs_type = obs.type
+
+                # GENERATION = LLM inference call. One walk over the
+                # observation's input/output yields the span messages AND the
+                # prompt/response texts - previously the same payloads were
+                # traversed twice (once for messages, once for text).
                 if obs_type == "GENERATION":
-                    span_info = self._create_span_info(obs, session_id, trace_id)
-                    inference_span = self._convert_to_inference_span(obs, span_info)
-                    inference_spans.append(inference_span)
-                    
-                    # Extract user prompt from first generation's input
-                    if not user_prompt:
-                        input_data = getattr(obs, "input", None)
-                        user_prompt = self._extract_user_prompt_text(input_data)
-                    
-                    # Extract agent response from last generation's output
-                    output_data = getattr(obs, "output", None)
-                    response_text = self._extract_response_text(output_data)
-                    if response_text:
+                    span_info = _create_span_info(obs, session_id, trace_id)
+                    messages, last_user, response_text = self._build_inference_messages(obs)
+                    inference_spans.append(
+                        _InferenceSpan(span_info=span_info, messages=messages, metadata={})
+                    )
+
+                    # User prompt comes from the first generation's input
+                    if not user_prompt and last_user:
+                        user_prompt = last_user
+
+                    # Agent response comes from the last generation's output;
+                    # earlier generations' texts would be overwritten anyway
+                    if i == last_gen_idx and response_text:
                         agent_response = response_text
-                        
+
                 # Tool executions (type=TOOL or name contains "tool")
-                elif obs_type == "TOOL" or (obs_name and "tool" in obs_name.lower()):
-                    span_info = self._create_span_info(obs, session_id, trace_id)
-                    tool_span = self._convert_to_tool_execution_span(obs, span_info)
-                    tool_spans.append(tool_span)
-                    
+                else:
+                    if obs_type != "TOOL":
+                        obs_name = obs.name
+                        if not (obs_name and "tool" in obs_name.lower()):
+                            continue
+                    span_info = _create_span_info(obs, session_id, trace_id)
+                    tool_spans.append(_to_tool(obs, span_info))
+
             except Exception as e:
-                logger.warning(f"Failed to convert observation {obs.id}: {e}")
+                logger.warning("Failed to convert observation %s: %s", obs.id, e)
 
-        # Build session_history from inference spans
-        session_history: list[UserMessage | AssistantMessage] = []
-        for inf_span in inference_spans:
-            session_history.extend(inf_span.messages)
+        # The inference spans already hold the conversation history; all the
+        # agent-span check needs is whether any messages exist, so don't
+        # concatenate them into a throwaway list
+        has_history = any(inf_span.messages for inf_span in inference_spans)
 
         # Create single AgentInvocationSpan representing the whole trace
-        spans: list[InferenceSpan | ToolExecutionSpan | AgentInvocationSpan] = []
-        
-        if user_prompt or agent_response or session_history:
+        agent_span: AgentInvocationSpan | None = None
+
+        if user_prompt or agent_response or has_history:
             # Use trace-level timestamps for the agent invocation span
             start_time = getattr(sorted_obs[0], "start_time", None) if sorted_obs else datetime.now(timezone.utc)
             end_time = getattr(sorted_obs[-1], "end_time", None) if sorted_obs else start_time
             
-            agent_span_info = SpanInfo(
+            agent_span_info = _SpanInfo(
                 trace_id=trace_id,
                 span_id=f"{trace_id}_agent",
                 session_id=session_id,
                 parent_span_id=None,
-                start_time=start_time if isinstance(start_time, datetime) else datetime.fromisoformat(str(start_time)),
-                end_time=end_time if isinstance(end_time, datetime) else datetime.fromisoformat(str(end_time)),
+                start_time=_to_dt(start_time),
+                end_time=_to_dt(end_time),
             )
-            
-            agent_span = AgentInvocationSpan(
+
+            agent_span = _AgentInvocationSpan(
                 span_info=agent_span_info,
                 user_prompt=user_prompt,
                 agent_response=agent_response,
                 available_tools=[],  # TODO: Extract from trace metadata if available
             )
-            spans.append(agent_span)
-        
-        # Also include inference and tool spans for detailed analysis
-        spans.extend(inference_spans)
-        spans.extend(tool_spans)
 
-        logger.debug(f"Converted trace {trace_id}: 1 agent span, {len(inference_spans)} inference, {len(tool_spans)} tool")
+        # Single allocation: agent span first, then - only when a consumer
+        # asked for them - the per-observation spans. Most evaluators read
+        # just the agent span, and the detail spans double list size, cache
+        # pickle size, and evaluator iteration cost.
+        detail = self.include_detail_spans
+        spans: list[InferenceSpan | ToolExecutionSpan | AgentInvocationSpan] = [
+            *([agent_span] if agent_span is not None else []),
+            *(inference_spans if detail else ()),
+            *(tool_spans if detail else ()),
+        ]
+
+        logger.debug("Converted trace %s: 1 agent span, %d inference, %d tool", trace_id, len(inference_spans), len(tool_spans))
         return Trace(spans=spans, trace_id=trace_id, session_id=session_id)
     
+    def _build_inference_messages(
+        self, obs: Any
+    ) -> tuple[list[UserMessage | AssistantMessage], str, str]:
+        """Extract messages plus prompt/response texts from a GENERATION observation.
+
+        Returns (messages, last_user_text, response_text), each derived from a
+        single traversal of the observation's input and output payloads.
+        """
+        messages: list[UserMessage | AssistantMessage] = []
+        last_user = ""
+        response_text = ""
+
+        input_data = obs.input
+        if input_data:
+            user_messages, last_user = self._extract_user_messages_and_prompt(input_data)
+            messages.extend(user_messages)
+
+        output_data = obs.output
+        if output_data:
+            assistant_messages, response_text = self._extract_assistant_messages_and_text(output_data)
+            messages.extend(assistant_messages)
+
+        return messages, last_user, response_text
+
     def _extract_user_prompt_text(self, input_data: Any) -> str:
         """Extract the LAST user prompt text from input data.
-        
+
         In multi-turn conversations, the input contains the full conversation history.
         We want the last user message, which is the one that triggered this agent turn.
         """
-        if isinstance(input_data, list):
-            # Collect all user messages, then return the last one
-            last_user_content = ""
-            for msg in input_data:
-                if isinstance(msg, dict) and msg.get("role") == "user":
-                    content = msg.get("content", "")
-                    if isinstance(content, str):
-                        last_user_content = content
-                    elif isinstance(content, list) and content:
-                        first = content[0]
-                        if isinstance(first, dict) and "text" in first:
-                            last_user_content = first["text"]
-                        elif isinstance(first, str):
-                            last_user_content = first
-            return last_user_content
-        elif isinstance(input_data, dict):
-            return input_data.get("content", input_data.get("text", input_data.get("prompt", "")))
-        elif isinstance(input_data, str):
-            return input_data
-        return ""
-    
+        return self._extract_user_messages_and_prompt(input_data)[1]
+
+
     def _extract_response_text(self, output_data: Any) -> str:
         """Extract response text from output data.
         
@@ -277,18 +737,25 @@ class LangfuseSessionMapper(SessionMapper):
         - {"response": "..."} - legacy format
         - "string" - raw string
         """
-        if isinstance(output_data, dict):
-            # Check common keys in order of preference
-            for key in ["content", "text", "message", "response"]:
+        # Langfuse payloads are plain dicts/lists/strings (never
+        # subclasses), so exact type tests are safe and skip the mro walk
+        t = type(output_data)
+        if t is dict:
+            # Probe the key that hit last time first, then the full list in
+            # order of preference
+            last = self._last_output_key
+            keys = (last,) if last else ()
+            for key in (*keys, "content", "text", "message", "response"):
                 value = output_data.get(key)
                 if value:
-                    if isinstance(value, str):
+                    self._last_output_key = key
+                    if type(value) is str:
                         return value
-                    elif isinstance(value, dict):
+                    elif type(value) is dict:
                         # Nested content (e.g., {"message": {"content": "..."}})
                         return value.get("content", value.get("text", str(value)))
             return ""
-        elif isinstance(output_data, str):
+        elif t is str:
             return output_data
         return ""
 
@@ -297,63 +764,74 @@ class LangfuseSessionMapper(SessionMapper):
         start_time = getattr(obs, "start_time", None) or datetime.now(timezone.utc)
         end_time = getattr(obs, "end_time", None) or start_time
 
-        return SpanInfo(
+        return _SpanInfo(
             trace_id=trace_id,
             span_id=obs.id,
             session_id=session_id,
             parent_span_id=getattr(obs, "parent_observation_id", None),
-            start_time=start_time if isinstance(start_time, datetime) else datetime.fromisoformat(str(start_time)),
-            end_time=end_time if isinstance(end_time, datetime) else datetime.fromisoformat(str(end_time)),
+            start_time=_to_dt(start_time),
+            end_time=_to_dt(end_time),
         )
 
     def _convert_to_inference_span(self, obs: Any, span_info: SpanInfo) -> InferenceSpan:
         """Convert a GENERATION observation to InferenceSpan."""
-        messages: list[UserMessage | AssistantMessage] = []
-
-        # Extract input messages
-        input_data = getattr(obs, "input", None)
-        if input_data:
-            user_messages = self._extract_user_messages(input_data)
-            messages.extend(user_messages)
-
-        # Extract output messages
-        output_data = getattr(obs, "output", None)
-        if output_data:
-            assistant_messages = self._extract_assistant_messages(output_data)
-            messages.extend(assistant_messages)
-
-        return InferenceSpan(span_info=span_info, messages=messages, metadata={})
+        messages, _, _ = self._build_inference_messages(obs)
+        return _InferenceSpan(span_info=span_info, messages=messages, metadata={})
 
     def _extract_user_messages(self, input_data: Any) -> list[UserMessage]:
         """Extract user messages from Langfuse input data."""
-        messages = []
+        return self._extract_user_messages_and_prompt(input_data)[0]
 
-        if isinstance(input_data, list):
+    def _extract_user_messages_and_prompt(self, input_data: Any) -> tuple[list[UserMessage], str]:
+        """Extract user messages and the last user prompt text in one walk.
+
+        The prompt text is the last user message's content - in multi-turn
+        conversations that is the message that triggered this agent turn.
+        """
+        messages: list[UserMessage] = []
+        last_user = ""
+
+        t = type(input_data)
+        if t is list:
             for msg in input_data:
-                if isinstance(msg, dict):
-                    role = msg.get("role", "")
+                if type(msg) is dict and msg.get("role") == "user":
                     content = msg.get("content", "")
-
-                    if role == "user":
-                        if isinstance(content, str):
-                            messages.append(UserMessage(content=[TextContent(text=content)]))
-                        elif isinstance(content, list):
-                            contents = self._parse_content_list_for_user(content)
-                            if contents:
-                                messages.append(UserMessage(content=contents))
-        elif isinstance(input_data, dict):
+                    ct = type(content)
+
+                    if ct is str:
+                        messages.append(_UserMessage(content=[_TextContent(text=content)]))
+                        last_user = content
+                    elif ct is list:
+                        contents = self._parse_content_list_for_user(content)
+                        if contents:
+                            messages.append(_UserMessage(content=contents))
+                        if content:
+                            first = content[0]
+                            if type(first) is dict and "text" in first:
+                                last_user = first["text"]
+                            elif type(first) is str:
+                                last_user = first
+        elif t is dict:
             # Handle single message format
             content = input_data.get("content", input_data.get("text", ""))
             if content:
-                messages.append(UserMessage(content=[TextContent(text=str(content))]))
-        elif isinstance(input_data, str):
-            messages.append(UserMessage(content=[TextContent(text=input_data)]))
+                messages.append(_UserMessage(content=[_TextContent(text=str(content))]))
+            last_user = input_data.get("content", input_data.get("text", input_data.get("prompt", "")))
+        elif t is str:
+            messages.append(_UserMessage(content=[_TextContent(text=input_data)]))
+            last_user = input_data
 
-        return messages
+        return messages, last_user
 
     def _extract_assistant_messages(self, output_data: Any) -> list[AssistantMessage]:
-        """Extract assistant messages from Langfuse output data.
-        
+        """Extract assistant messages from Langfuse output data."""
+        return self._extract_assistant_messages_and_text(output_data)[0]
+
+    def _extract_assistant_messages_and_text(
+        self, output_data: Any
+    ) -> tuple[list[AssistantMessage], str]:
+        """Extract assistant messages and the response text in one walk.
+
         Handles multiple output formats:
         - {"content": "..."} - standard format
         - {"text": "..."} - alternative format
@@ -362,86 +840,102 @@ class LangfuseSessionMapper(SessionMapper):
         """
         messages = []
 
-        if isinstance(output_data, dict):
-            # Try to extract text content from various keys
+        t = type(output_data)
+        if t is dict:
+            # Try to extract text content from various keys, probing the key
+            # that hit on the previous observation first
             content = ""
-            
-            # Check standard keys first
-            if output_data.get("content"):
-                content = str(output_data["content"])
-            elif output_data.get("text"):
-                content = str(output_data["text"])
-            elif output_data.get("message"):
+
+            hit_key = None
+            last = self._last_output_key
+            keys = (last,) if last in ("content", "text", "message") else ()
+            for key in (*keys, "content", "text", "message"):
+                if output_data.get(key):
+                    hit_key = key
+                    self._last_output_key = key
+                    break
+
+            if hit_key in ("content", "text"):
+                content = str(output_data[hit_key])
+            elif hit_key == "message":
                 # Handle Bedrock/OTLP "message" format
                 msg = output_data["message"]
-                if isinstance(msg, str):
-                    # Try to parse as JSON (Bedrock format)
+                mt = type(msg)
+                if mt is str:
+                    # Try to parse as JSON (Bedrock format); ValueError covers
+                    # both json.JSONDecodeError and orjson.JSONDecodeError
                     try:
-                        parsed = json.loads(msg)
+                        parsed = _json_loads(msg)
                         content = self._extract_text_from_content_blocks(parsed)
-                    except json.JSONDecodeError:
+                    except ValueError:
                         # Plain string
                         content = msg
-                elif isinstance(msg, list):
+                elif mt is list:
                     content = self._extract_text_from_content_blocks(msg)
-                elif isinstance(msg, dict):
+                elif mt is dict:
                     content = msg.get("content", msg.get("text", str(msg)))
             
             tool_calls = output_data.get("tool_calls", [])
 
             contents: list[TextContent | ToolCallContent] = []
             if content:
-                contents.append(TextContent(text=content))
+                contents.append(_TextContent(text=content))
             for tc in tool_calls:
                 contents.append(
-                    ToolCallContent(
+                    _ToolCallContent(
                         name=tc.get("function", {}).get("name", tc.get("name", "")),
                         arguments=tc.get("function", {}).get("arguments", tc.get("arguments", {})),
                         tool_call_id=tc.get("id"),
                     )
                 )
             if contents:
-                messages.append(AssistantMessage(content=contents))
+                messages.append(_AssistantMessage(content=contents))
+
+            return messages, content
 
-        elif isinstance(output_data, str):
-            messages.append(AssistantMessage(content=[TextContent(text=output_data)]))
+        elif t is str:
+            messages.append(_AssistantMessage(content=[_TextContent(text=output_data)]))
+            return messages, output_data
 
-        return messages
+        return messages, ""
     
     def _extract_text_from_content_blocks(self, blocks: list | Any) -> str:
         """Extract text from Bedrock/Claude content block format.
-        
+
         Handles formats like:
         - [{"text": "..."}, ...]
         - [{"reasoningContent": {"reasoningText": {"text": "..."}}}, ...]
         """
         if not isinstance(blocks, list):
             return str(blocks)
-        
-        texts = []
+        # Stream texts through a generator and join once at the top level,
+        # rather than building an intermediate list (and an intermediate
+        # joined string) per recursion level
+        return "\n".join(self._iter_texts(blocks))
+
+    def _iter_texts(self, blocks: list):
+        """Yield text fragments from a list of content blocks, depth-first."""
         for block in blocks:
             if isinstance(block, str):
-                texts.append(block)
+                yield block
             elif isinstance(block, dict):
                 # Direct text field
                 if "text" in block:
-                    texts.append(block["text"])
+                    yield block["text"]
                 # Reasoning content (Claude thinking)
                 elif "reasoningContent" in block:
                     reasoning = block["reasoningContent"]
                     if isinstance(reasoning, dict):
                         reasoning_text = reasoning.get("reasoningText", {})
                         if isinstance(reasoning_text, dict) and "text" in reasoning_text:
-                            texts.append(reasoning_text["text"])
+                            yield reasoning_text["text"]
                 # Content field
                 elif "content" in block:
                     content = block["content"]
                     if isinstance(content, str):
-                        texts.append(content)
+                        yield content
                     elif isinstance(content, list):
-                        texts.append(self._extract_text_from_content_blocks(content))
-        
-        return "\n".join(texts) if texts else ""
+                        yield from self._iter_texts(content)
 
     def _parse_content_list_for_user(self, content_list: list) -> list[TextContent | ToolResultContent]:
         """Parse a content list for user messages."""
@@ -449,7 +943,7 @@ class LangfuseSessionMapper(SessionMapper):
         for item in content_list:
             if isinstance(item, dict):
                 if "text" in item:
-                    result.append(TextContent(text=item["text"]))
+                    result.append(_TextContent(text=item["text"]))
                 elif "toolResult" in item:
                     tool_result = item["toolResult"]
                     result_text = ""
@@ -460,42 +954,65 @@ class LangfuseSessionMapper(SessionMapper):
                         elif isinstance(content, str):
                             result_text = content
                     result.append(
-                        ToolResultContent(
+                        _ToolResultContent(
                             content=result_text,
                             error=tool_result.get("error"),
                             tool_call_id=tool_result.get("toolUseId"),
                         )
                     )
             elif isinstance(item, str):
-                result.append(TextContent(text=item))
+                result.append(_TextContent(text=item))
         return result
 
     def _convert_to_tool_execution_span(self, obs: Any, span_info: SpanInfo) -> ToolExecutionSpan:
         """Convert an observation to ToolExecutionSpan."""
-        input_data = getattr(obs, "input", {}) or {}
-        output_data = getattr(obs, "output", {}) or {}
-        metadata = getattr(obs, "metadata", {}) or {}
+        input_data = obs.input or {}
+        output_data = obs.output or {}
+        metadata = obs.metadata or {}
+
+        # Fast path: Strands-instrumented traces emit structured metadata and
+        # a plain-string output, so the span can be built with no further
+        # format probing
+        if (
+            type(metadata) is dict
+            and "tool_name" in metadata
+            and "tool_call_id" in metadata
+            and type(output_data) is str
+        ):
+            tool_call_id = metadata["tool_call_id"]
+            return _ToolExecutionSpan(
+                span_info=span_info,
+                tool_call=_ToolCall(
+                    name=metadata["tool_name"],
+                    arguments=input_data.get("arguments", input_data)
+                    if type(input_data) is dict
+                    else {"input": input_data},
+                    tool_call_id=tool_call_id,
+                ),
+                tool_result=_ToolResult(content=output_data, error=None, tool_call_id=tool_call_id),
+                metadata={},
+            )
 
         tool_name = metadata.get("tool_name", getattr(obs, "name", "unknown"))
         tool_call_id = metadata.get("tool_call_id", obs.id)
 
         # Extract arguments
         arguments = {}
-        if isinstance(input_data, dict):
+        if type(input_data) is dict:
             arguments = input_data.get("arguments", input_data)
-        elif isinstance(input_data, str):
+        elif type(input_data) is str:
             arguments = {"input": input_data}
 
         # Extract result
         result_content = ""
         error = None
-        if isinstance(output_data, dict):
+        if type(output_data) is dict:
             result_content = output_data.get("result", output_data.get("content", str(output_data)))
             error = output_data.get("error")
-        elif isinstance(output_data, str):
+        elif type(output_data) is str:
             result_content = output_data
 
-        tool_call = ToolCall(name=tool_name, arguments=arguments, tool_call_id=tool_call_id)
-        tool_result = ToolResult(content=str(result_content), error=error, tool_call_id=tool_call_id)
+        tool_call = _ToolCall(name=tool_name, arguments=arguments, tool_call_id=tool_call_id)
+        tool_result = _ToolResult(content=str(result_content), error=error, tool_call_id=tool_call_id)
 
-        return ToolExecutionSpan(span_info=span_info, tool_call=tool_call, tool_result=tool_result, metadata={})
+        return _ToolExecutionSpan(span_info=span_info, tool_call=tool_call, tool_result=tool_result, metadata={})
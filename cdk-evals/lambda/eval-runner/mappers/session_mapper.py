@@ -44,9 +44,10 @@ class SessionMapper(ABC):
     def extract_input_output(session: Session) -> tuple[str, str]:
         """Extract user input and agent output from a Session.
 
-        Walks through traces and spans looking for AgentInvocationSpan which
-        contains the user_prompt and agent_response. Falls back to generic
-        span input/output attributes if no AgentInvocationSpan is found.
+        Mappers construct each trace with the AgentInvocationSpan first, so
+        the fast pass below normally returns after inspecting a single span.
+        Only sessions without any agent span fall through to the generic
+        second pass over span input/output attributes.
 
         Args:
             session: Session object containing traces and spans
@@ -54,19 +55,28 @@ class SessionMapper(ABC):
         Returns:
             Tuple of (user_input, agent_output)
         """
+        # Fast pass: the AgentInvocationSpan carries both fields directly
+        agent_span_type = AgentInvocationSpan
+        for trace in session.traces:
+            for span in trace.spans:
+                if isinstance(span, agent_span_type):
+                    return span.user_prompt or "", span.agent_response or ""
+
+        # Fallback: no agent span anywhere - scrape generic span attributes
         user_input = ""
         agent_output = ""
-
         for trace in session.traces:
             for span in trace.spans:
-                if isinstance(span, AgentInvocationSpan):
-                    agent_output = span.agent_response or ""
-                    if span.user_prompt and not user_input:
-                        user_input = span.user_prompt
-
-                if not user_input and hasattr(span, "input") and span.input:
-                    user_input = str(span.input)
-                if not agent_output and hasattr(span, "output") and span.output:
-                    agent_output = str(span.output)
+                # Single getattr-with-default instead of hasattr + access
+                if not user_input:
+                    span_input = getattr(span, "input", None)
+                    if span_input:
+                        user_input = str(span_input)
+                if not agent_output:
+                    span_output = getattr(span, "output", None)
+                    if span_output:
+                        agent_output = str(span_output)
+                if user_input and agent_output:
+                    return user_input, agent_output
 
         return user_input, agent_output
@@ -4,14 +4,20 @@ This module provides functions to export evaluation results directly to S3,
 enabling Lambda-based evaluation workflows where local file storage isn't available.
 """
 
-import json
+import gzip
+import io
 import logging
 import os
+import threading
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 if TYPE_CHECKING:
@@ -26,6 +32,90 @@ REGION = "us-east-1"
 # CloudFront distribution ID is passed from CDK via environment variable
 CLOUDFRONT_DISTRIBUTION_ID = os.environ.get("CLOUDFRONT_DISTRIBUTION_ID", "")
 
+# Wide pool for the parallel uploads, adaptive retries for S3's occasional
+# 503 SlowDown, keepalive so the pool survives idle gaps between invocations
+_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+
+# Clients are built once per container and reused across invocations -
+# construction parses the service model (tens of ms) and a fresh client
+# would also abandon the warm HTTPS connection pool
+_boto_session = None
+_s3_client = None
+_cloudfront_client = None
+
+# (ETag, parsed index) from the last runs_index.json round-trip. Lets
+# _update_runs_index issue a conditional GET and skip the download when the
+# object hasn't changed since this container last touched it.
+_runs_index_cache: tuple[str, dict] | None = None
+
+# Reports from large experiments can run to many megabytes; upload them in
+# 8 MiB multipart chunks so transfer memory stays O(chunk) and parts move
+# in parallel. Small reports fall below the threshold and go up in one PUT.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=True,
+)
+
+
+def _get_session():
+    """Return the shared boto3 Session, built on first use.
+
+    Both clients hang off one explicit Session so credentials and the
+    endpoint/service data are resolved once, and client creation skips the
+    lock contention on boto3's implicit default session.
+    """
+    global _boto_session
+    if _boto_session is None:
+        _boto_session = boto3.session.Session(region_name=REGION)
+    return _boto_session
+
+
+def _get_s3_client():
+    """Return the shared S3 client, built on first use."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = _get_session().client("s3", config=_CLIENT_CONFIG)
+    return _s3_client
+
+
+def _get_cloudfront_client():
+    """Return the shared CloudFront client, built on first use."""
+    global _cloudfront_client
+    if _cloudfront_client is None:
+        _cloudfront_client = _get_session().client("cloudfront", config=_CLIENT_CONFIG)
+    return _cloudfront_client
+
+
+def _json_body(obj) -> bytes:
+    """Serialize obj to gzipped, 2-space-indented JSON for an S3 PUT Body.
+
+    orjson serializes straight to bytes in native code - several times
+    faster than json.dumps and with no str intermediate to re-encode.
+    Indented JSON compresses 5-10x at level 6 (the speed/ratio sweet spot),
+    cutting both transfer time and the bytes CloudFront serves to the
+    dashboard. Callers must set ContentEncoding="gzip" on the PUT so
+    browsers decompress transparently.
+    """
+    return gzip.compress(orjson.dumps(obj, option=orjson.OPT_INDENT_2), 6)
+
+
+def _read_json(response) -> dict:
+    """Parse a JSON S3 GetObject response, decompressing gzip bodies.
+
+    S3 stores ContentEncoding but does not decode it on GET, so objects we
+    wrote compressed come back as raw gzip bytes. The magic-byte check also
+    covers objects uploaded before compression carried the header.
+    """
+    data = response["Body"].read()
+    if response.get("ContentEncoding") == "gzip" or data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    return orjson.loads(data)
+
 
 def export_reports_to_s3(
     reports: list["EvaluationReport"],
@@ -46,37 +136,56 @@ def export_reports_to_s3(
     Returns:
         The run_id of the exported run
     """
-    s3 = boto3.client("s3", region_name=REGION)
-
-    # Create timestamped run ID
-    timestamp = datetime.now()
+    s3 = _get_s3_client()
+
+    # Create timestamped run ID. The timestamp (and its ISO form) is taken
+    # once and threaded through - datetime.now and isoformat are cheap but
+    # repeating them risks the manifest and index disagreeing on the instant.
+    # UTC keeps run ids and index ordering stable regardless of host tz.
+    timestamp = datetime.now(timezone.utc)
+    timestamp_iso = timestamp.isoformat()
     run_id = f"{run_id_prefix}_{timestamp.strftime('%Y-%m-%dT%H-%M-%S')}_langfuse"
 
     logger.info(f"Exporting run {run_id} to S3 bucket {BUCKET_NAME}")
 
-    # Export each evaluator's report as a separate JSON file
-    for report, evaluator in zip(reports, experiment.evaluators):
-        evaluator_name = evaluator.get_type_name()
-        s3_key = f"runs/{run_id}/eval_{evaluator_name}.json"
-
-        # Get report as JSON string
-        report_json = report.model_dump_json()
+    # Serialize every evaluator's report first, then fan the uploads out -
+    # they are independent PUTs dominated by network RTT, so running them
+    # serially scaled wall time with evaluator count. boto3 clients are
+    # thread-safe, so the workers share one client (and its pool).
+    # get_type_name() walks the class each call; resolve every evaluator's
+    # name once and reuse the list for the upload keys, manifest and index
+    names = [e.get_type_name() for e in experiment.evaluators]
 
-        logger.info(f"  Uploading eval_{evaluator_name}.json")
-        s3.put_object(
-            Bucket=BUCKET_NAME,
-            Key=s3_key,
-            Body=report_json,
-            ContentType="application/json",
+    uploads = []
+    for report, evaluator_name in zip(reports, names):
+        s3_key = f"runs/{run_id}/eval_{evaluator_name}.json"
+        # Encode to bytes once up front; put_object would otherwise hold the
+        # str and its UTF-8 copy simultaneously inside botocore
+        uploads.append((s3_key, gzip.compress(report.model_dump_json().encode("utf-8"), 6)))
+
+    def _put_report(item: tuple[str, bytes]) -> None:
+        s3_key, body = item
+        logger.info(f"  Uploading {s3_key.rsplit('/', 1)[-1]}")
+        s3.upload_fileobj(
+            io.BytesIO(body),
+            BUCKET_NAME,
+            s3_key,
+            Config=_TRANSFER_CONFIG,
+            ExtraArgs={"ContentType": "application/json", "ContentEncoding": "gzip"},
         )
 
+    if uploads:
+        with ThreadPoolExecutor(max_workers=min(16, len(uploads))) as executor:
+            # list() propagates any upload exception to the caller
+            list(executor.map(_put_report, uploads))
+
     # Export manifest
     manifest = {
         "run_id": run_id,
-        "timestamp": timestamp.isoformat(),
-        "evaluators": [e.get_type_name() for e in experiment.evaluators],
+        "timestamp": timestamp_iso,
+        "evaluators": names,
         "total_cases": len(experiment.cases),
-        "files": [f"eval_{e.get_type_name()}.json" for e in experiment.evaluators],
+        "files": [f"eval_{name}.json" for name in names],
         "source": source,
         "agent_type": agent_type,
     }
@@ -86,15 +195,19 @@ def export_reports_to_s3(
     s3.put_object(
         Bucket=BUCKET_NAME,
         Key=manifest_key,
-        Body=json.dumps(manifest, indent=2),
+        Body=_json_body(manifest),
         ContentType="application/json",
+        ContentEncoding="gzip",
     )
 
     # Update runs_index.json
-    _update_runs_index(s3, run_id, timestamp, experiment, agent_type)
+    index_changed = _update_runs_index(s3, run_id, timestamp_iso, len(experiment.cases), names, agent_type)
 
-    # Invalidate CloudFront cache for runs_index.json
-    _invalidate_cloudfront_cache()
+    # Queue a CloudFront invalidation for runs_index.json; back-to-back
+    # exports share one invalidation request, and an unchanged index (e.g.
+    # an idempotent re-export) needs none at all
+    if index_changed:
+        _queue_invalidation()
 
     logger.info(f"Run '{run_id}' exported successfully to S3: s3://{BUCKET_NAME}/runs/{run_id}/")
 
@@ -108,7 +221,7 @@ def export_insights_to_s3(insights: dict, run_id: str) -> None:
         insights: Insights dict from generate_insights()
         run_id: The run ID to export insights for
     """
-    s3 = boto3.client("s3", region_name=REGION)
+    s3 = _get_s3_client()
 
     insights["run_id"] = run_id
 
@@ -118,21 +231,23 @@ def export_insights_to_s3(insights: dict, run_id: str) -> None:
     s3.put_object(
         Bucket=BUCKET_NAME,
         Key=insights_key,
-        Body=json.dumps(insights, indent=2),
+        Body=_json_body(insights),
         ContentType="application/json",
+        ContentEncoding="gzip",
     )
 
     # Update manifest with has_insights flag
     manifest_key = f"runs/{run_id}/manifest.json"
     try:
         response = s3.get_object(Bucket=BUCKET_NAME, Key=manifest_key)
-        manifest = json.loads(response["Body"].read().decode("utf-8"))
+        manifest = _read_json(response)
         manifest["has_insights"] = True
         s3.put_object(
             Bucket=BUCKET_NAME,
             Key=manifest_key,
-            Body=json.dumps(manifest, indent=2),
+            Body=_json_body(manifest),
             ContentType="application/json",
+            ContentEncoding="gzip",
         )
         logger.info("  Updated manifest.json with has_insights=true")
     except ClientError as e:
@@ -142,27 +257,43 @@ def export_insights_to_s3(insights: dict, run_id: str) -> None:
 def _update_runs_index(
     s3,
     run_id: str,
-    timestamp: datetime,
-    experiment: "Experiment",
+    timestamp_iso: str,
+    total_cases: int,
+    evaluator_names: list[str],
     agent_type: str = "",
-) -> None:
+) -> bool:
     """Update the runs_index.json file in S3.
 
     Args:
         s3: boto3 S3 client
         run_id: The run identifier
-        timestamp: Run timestamp
-        experiment: The Experiment object
+        timestamp_iso: Run timestamp as an ISO-8601 string
+        total_cases: Number of cases in the run
+        evaluator_names: Resolved evaluator type names for the run
         agent_type: Agent type identifier for dashboard filtering
+
+    Returns:
+        True if the index changed and was re-uploaded, False if the entry
+        was already present verbatim (nothing written, no invalidation needed)
     """
+    global _runs_index_cache
     runs_index_key = "runs_index.json"
 
-    # Try to download existing runs_index.json
+    # Try to download existing runs_index.json. On warm containers the index
+    # usually hasn't changed since our own last PUT, so send the cached ETag
+    # and let S3 answer 304 instead of shipping the whole document again.
     try:
-        response = s3.get_object(Bucket=BUCKET_NAME, Key=runs_index_key)
-        runs_index = json.loads(response["Body"].read().decode("utf-8"))
+        get_kwargs = {"Bucket": BUCKET_NAME, "Key": runs_index_key}
+        if _runs_index_cache is not None:
+            get_kwargs["IfNoneMatch"] = _runs_index_cache[0]
+        response = s3.get_object(**get_kwargs)
+        runs_index = _read_json(response)
     except ClientError as e:
-        if e.response["Error"]["Code"] == "NoSuchKey":
+        code = e.response["Error"]["Code"]
+        if code in ("304", "NotModified"):
+            logger.info("  runs_index.json unchanged (ETag match), reusing cached copy")
+            runs_index = _runs_index_cache[1]
+        elif code == "NoSuchKey":
             logger.info("  Creating new runs_index.json")
             runs_index = {"runs": []}
         else:
@@ -171,48 +302,198 @@ def _update_runs_index(
     # Create new run entry
     new_entry = {
         "run_id": run_id,
-        "timestamp": timestamp.isoformat(),
-        "total_cases": len(experiment.cases),
-        "evaluator_count": len(experiment.evaluators),
+        "timestamp": timestamp_iso,
+        "total_cases": total_cases,
+        "evaluator_count": len(evaluator_names),
         "agent_type": agent_type,
     }
 
-    # Remove existing entry with same run_id (if re-uploading)
-    runs_index["runs"] = [r for r in runs_index["runs"] if r["run_id"] != run_id]
-
-    # Add new entry at the beginning
-    runs_index["runs"].insert(0, new_entry)
-
-    # Sort by timestamp descending
-    runs_index["runs"].sort(key=lambda r: r.get("timestamp", ""), reverse=True)
+    # Merge through a dict keyed on run_id: replaces the old filter-copy +
+    # insert(0) + full re-sort with one pass that dedupes re-uploads, then a
+    # single sort by timestamp descending
+    by_id = {r["run_id"]: r for r in runs_index["runs"]}
+    if by_id.get(run_id) == new_entry:
+        # Idempotent re-export: the entry is already in the index verbatim,
+        # so skip the writes and tell the caller no invalidation is needed
+        logger.info("  runs_index.json already up to date for this run")
+        return False
+    by_id[run_id] = new_entry
+
+    # Also drop the entry as a per-run sidecar. Unlike the shared index,
+    # sidecar writes never race between concurrent exports (last-writer-wins
+    # on runs_index.json can lose entries), and rebuild_runs_index can
+    # reconstruct the full index from them at any time.
+    s3.put_object(
+        Bucket=BUCKET_NAME,
+        Key=f"runs/{run_id}/_index_entry.json",
+        Body=_json_body(new_entry),
+        ContentType="application/json",
+        ContentEncoding="gzip",
+    )
+    runs_index["runs"] = sorted(
+        by_id.values(), key=lambda r: r.get("timestamp", ""), reverse=True
+    )
 
     # Upload updated runs_index.json
     logger.info("  Updating runs_index.json")
-    s3.put_object(
+    put_response = s3.put_object(
         Bucket=BUCKET_NAME,
         Key=runs_index_key,
-        Body=json.dumps(runs_index, indent=2),
+        Body=_json_body(runs_index),
         ContentType="application/json",
+        ContentEncoding="gzip",
     )
 
+    # Remember what we just wrote so the next export in this container can
+    # validate with If-None-Match instead of re-downloading the index
+    etag = put_response.get("ETag")
+    if etag:
+        _runs_index_cache = (etag, runs_index)
+    return True
+
+
+def run_exists(run_id: str, s3=None) -> bool:
+    """Return True if a run was already fully exported.
+
+    The manifest is written after every report upload succeeds, so its
+    presence marks a completed export. A HEAD request answers this without
+    downloading anything.
+
+    Args:
+        run_id: The run identifier to probe
+        s3: boto3 S3 client (a default client is created if omitted)
+    """
+    if s3 is None:
+        s3 = _get_s3_client()
+    try:
+        s3.head_object(Bucket=BUCKET_NAME, Key=f"runs/{run_id}/manifest.json")
+        return True
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return False
+        raise
+
+
+def filter_completed_runs(run_ids: list[str], s3=None) -> set[str]:
+    """Return the subset of run_ids that already have a completed export.
+
+    Lets batch/re-drive tooling skip work that landed in an earlier
+    invocation (SQS delivers at-least-once) instead of re-running the
+    evaluators. The probes are independent HEAD requests, so they run
+    concurrently rather than paying one round-trip per run.
+
+    Args:
+        run_ids: Run identifiers to probe
+        s3: boto3 S3 client (a default client is created if omitted)
+    """
+    if not run_ids:
+        return set()
+    if s3 is None:
+        s3 = _get_s3_client()
+    with ThreadPoolExecutor(max_workers=min(16, len(run_ids))) as executor:
+        flags = executor.map(lambda rid: run_exists(rid, s3), run_ids)
+        return {rid for rid, done in zip(run_ids, flags) if done}
 
-def _invalidate_cloudfront_cache() -> None:
-    """Invalidate CloudFront cache for runs_index.json."""
-    cloudfront = boto3.client("cloudfront", region_name=REGION)
 
+def rebuild_runs_index(s3=None) -> dict:
+    """Rebuild runs_index.json from the per-run _index_entry.json sidecars.
+
+    Recovers the index after entries were lost to concurrent last-writer-wins
+    updates, or backfills it for runs exported while the shared index was
+    unavailable. Intended for on-demand/scheduled use, not the export hot path.
+
+    Args:
+        s3: boto3 S3 client (a default client is created if omitted)
+
+    Returns:
+        The rebuilt index dict that was uploaded
+    """
+    if s3 is None:
+        s3 = _get_s3_client()
+
+    entry_keys = []
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix="runs/"):
+        for obj in page.get("Contents", []):
+            if obj["Key"].endswith("/_index_entry.json"):
+                entry_keys.append(obj["Key"])
+
+    def _fetch_entry(key: str) -> dict:
+        return _read_json(s3.get_object(Bucket=BUCKET_NAME, Key=key))
+
+    entries = []
+    if entry_keys:
+        with ThreadPoolExecutor(max_workers=min(16, len(entry_keys))) as executor:
+            entries = list(executor.map(_fetch_entry, entry_keys))
+
+    entries.sort(key=lambda r: r.get("timestamp", ""), reverse=True)
+    runs_index = {"runs": entries}
+
+    logger.info(f"Rebuilt runs_index.json from {len(entries)} sidecar entries")
+    s3.put_object(
+        Bucket=BUCKET_NAME,
+        Key="runs_index.json",
+        Body=_json_body(runs_index),
+        ContentType="application/json",
+        ContentEncoding="gzip",
+    )
+    return runs_index
+
+
+# Invalidations are rate-limited and billed per path past the free tier, so
+# exports landing in quick succession should share one request. Paths queue
+# up here and are flushed in a single create_invalidation call - either by
+# the short debounce timer or by an explicit flush_invalidations() at the
+# end of a batch (the Lambda handler does the latter, since a timer may not
+# fire before the container is frozen).
+_pending_paths: set[str] = set()
+_pending_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+_FLUSH_DELAY_S = 2.0
+# Past this many distinct paths a wildcard is cheaper than itemizing
+_WILDCARD_THRESHOLD = 15
+
+
+def _queue_invalidation(paths: tuple[str, ...] = ("/runs_index.json",)) -> None:
+    """Queue CloudFront paths for a coalesced invalidation."""
+    global _flush_timer
+    with _pending_lock:
+        _pending_paths.update(paths)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_DELAY_S, flush_invalidations)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_invalidations() -> None:
+    """Issue one CloudFront invalidation for all queued paths, if any."""
+    global _flush_timer
+    with _pending_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _pending_paths:
+            return
+        paths = sorted(_pending_paths)
+        _pending_paths.clear()
+
+    if len(paths) > _WILDCARD_THRESHOLD:
+        paths = ["/*"]
+
+    cloudfront = _get_cloudfront_client()
     try:
         caller_reference = f"s3-export-{uuid.uuid4().hex[:8]}"
         response = cloudfront.create_invalidation(
             DistributionId=CLOUDFRONT_DISTRIBUTION_ID,
             InvalidationBatch={
                 "Paths": {
-                    "Quantity": 1,
-                    "Items": ["/runs_index.json"],
+                    "Quantity": len(paths),
+                    "Items": paths,
                 },
                 "CallerReference": caller_reference,
             },
         )
         invalidation_id = response["Invalidation"]["Id"]
-        logger.info(f"CloudFront cache invalidation created: {invalidation_id}")
+        logger.info(f"CloudFront cache invalidation created: {invalidation_id} ({len(paths)} paths)")
     except ClientError as e:
         logger.warning(f"Failed to invalidate CloudFront cache: {e}")
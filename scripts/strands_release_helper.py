@@ -29,13 +29,13 @@ OUTPUT:
     └── {repo}/             # Cloned repositories
 
 REPOS COVERED:
-  - sdk-python      (hatch run test-integ)
-  - sdk-typescript  (npm run test:integ)
-  - tools           (hatch run test-integ)
-  - agent-sop       (hatch test)
-  - agent-builder   (hatch test)
-  - evals           (hatch run test-integ)
-  - mcp-server      (hatch test)
+  - sdk-python      (hatch run test-integ, sharded via pytest-xdist)
+  - sdk-typescript  (npm run test:integ, jest --maxWorkers=50%)
+  - tools           (hatch run test-integ, sharded via pytest-xdist)
+  - agent-sop       (hatch test -p)
+  - agent-builder   (hatch test -p)
+  - evals           (hatch run test-integ, sharded via pytest-xdist)
+  - mcp-server      (hatch test -p)
 
 VERSION BUMP LOGIC:
   For 1.x+ versions (standard semver):
@@ -51,35 +51,73 @@ VERSION BUMP LOGIC:
   - NONE: No commits since last tag
 
 NOTES:
-  - Tests run sequentially by default (parallel can cause port conflicts)
-  - --parallel only works with --skip-tests
-  - Test output streams live to console and saves to logs/
+  - --parallel runs all repos concurrently, including tests: each repo's
+    suite gets a disjoint port range via the PORT_BASE / TEST_PORT env vars
+    (suites that bind ports should honor them to stay conflict-free)
+  - Test output streams live to console (prefixed per repo) and saves to logs/
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from datetime import datetime
+import sysconfig
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
+# pygit2 (libgit2 bindings) lets tag listing and commit walking happen
+# in-process instead of paying a subprocess fork+exec per git query. It is
+# optional: every pygit2 path below falls back to the git CLI when the
+# module (or a readable repo) is unavailable.
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
 os.environ['AWS_REGION'] = 'us-east-1'
 
 
 def ensure_uv_installed():
-    """Ensure uv is installed, installing it if necessary."""
+    """Ensure uv is installed, installing it if necessary.
+
+    pip inside the interpreter already running this script is the cheap
+    path: one subprocess, no network shell-pipe through curl | sh and no
+    installer-script parse. The standalone installer stays as the fallback
+    for environments without pip.
+    """
     if shutil.which("uv"):
         print("uv is already installed.")
         return
 
-    print("uv not found. Installing uv...")
+    print("uv not found. Installing via pip...")
+    pip_result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--user", "--quiet", "uv"],
+        capture_output=True,
+    )
+    if pip_result.returncode == 0:
+        # pip --user drops the binary into the user scripts dir, which may
+        # not be on PATH yet in this process
+        user_scripts = sysconfig.get_path("scripts", f"{os.name}_user")
+        if user_scripts and user_scripts not in os.environ.get("PATH", ""):
+            os.environ["PATH"] = f"{user_scripts}{os.pathsep}{os.environ.get('PATH', '')}"
+        if shutil.which("uv"):
+            print("uv installed successfully (pip).")
+            return
+
+    print("pip install failed; falling back to the standalone installer...")
     code, stdout, stderr = run_cmd("curl -LsSf https://astral.sh/uv/install.sh | sh")
     if code != 0:
         sys.exit(1)
@@ -125,6 +163,21 @@ def setup_environment(work_dir: Path):
     os.environ["PATH"] = f"{venv_bin}{os.pathsep}{os.environ.get('PATH', '')}"
     os.environ.pop("PYTHONHOME", None)
 
+    # Skip the hatch install when nothing it depends on has changed: the
+    # venv existing says nothing about what's in it, so key on interpreter
+    # + uv version + the tool list and compare against the marker written
+    # after the last successful install.
+    _, uv_version, _ = run_cmd("uv --version")
+    cache_key = hashlib.sha256(f"{sys.version}|{uv_version.strip()}|hatch".encode()).hexdigest()
+    cache_file = venv_path / ".strands_cache"
+    try:
+        if cache_file.read_text() == cache_key:
+            print("hatch already installed (cache hit).")
+            print("Environment setup complete.\n")
+            return
+    except OSError:
+        pass
+
     # Install hatch
     print("Installing hatch via uv pip...")
     code, stdout, stderr = run_cmd("uv pip install hatch", cwd=work_dir)
@@ -132,70 +185,88 @@ def setup_environment(work_dir: Path):
         print(f"Failed to install hatch: {stderr}")
         sys.exit(1)
 
+    try:
+        cache_file.write_text(cache_key)
+    except OSError:
+        pass
+
     print("Environment setup complete.\n")
 
 
+@dataclass(frozen=True, slots=True)
+class RepoConfig:
+    """Static per-repo configuration.
+
+    Frozen + slotted: attribute access beats chained dict .get lookups in
+    the hot paths, typos fail loudly at definition time, and instances are
+    safely shared across worker threads/processes.
+    """
+
+    url: str
+    test_cmd: str
+    version_params: tuple[str, ...] = ()
+    changelog_params: tuple[str, ...] = ()
+    # Subdirectory the test command runs in, for repos whose package lives
+    # below the repo root (beats a `cd X &&` shell chain - one less fork)
+    test_cwd: str = ""
+
+
 # Repository configurations
 REPOS = {
-    "sdk-python": {
-        "url": "https://github.com/strands-agents/sdk-python",
-        "test_cmd": "hatch run test-integ",
-        "release_params": {
-            "version": ["strands-sdk-python-version", "strands-agent-sdk-python-version"],
-            "changelog": ["strands-agent-sdk-python-changelog"],
-        },
-    },
-    "sdk-typescript": {
-        "url": "https://github.com/strands-agents/sdk-typescript",
-        "test_cmd": "npm install && npm run test:integ",
-        "release_params": {
-            "version": ["strands-sdk-typescript-version", "strands-agent-sdk-typescript-version"],
-            "changelog": ["strands-agent-sdk-typescript-changelog"],
-        },
-    },
-    "tools": {
-        "url": "https://github.com/strands-agents/tools",
-        "test_cmd": "hatch run test-integ",
-        "release_params": {
-            "version": ["strands-tools-version", "strands-agent-tools-version"],
-            "changelog": ["strands-agent-tool-changelog"],
-        },
-    },
-    "agent-sop": {
-        "url": "https://github.com/strands-agents/agent-sop",
-        "test_cmd": "cd python && hatch test",
-        "release_params": {
-            "version": ["strands-agent-sop-version"],
-            "changelog": ["strands-agent-sop-changelog"],
-        },
-    },
-    "agent-builder": {
-        "url": "https://github.com/strands-agents/agent-builder",
-        "test_cmd": "hatch test",
-        "release_params": {
-            "version": ["strands-agent-builder-version"],
-            "changelog": ["strands-agent-builder-changelog"],
-        },
-    },
-    "evals": {
-        "url": "https://github.com/strands-agents/evals",
-        "test_cmd": "hatch run test-integ",
-        "release_params": {
-            "version": ["strands-evals-version", "strands-agent-evals-version"],
-            "changelog": ["strands-agent-sdk-evals-changelog"],
-        },
-    },
-    "mcp-server": {
-        "url": "https://github.com/strands-agents/mcp-server",
-        "test_cmd": "hatch test",
-        "release_params": {
-            "version": ["strands-mcp-server-version", "strands-agent-mcp-server-version"],
-            "changelog": ["strands-agent-mcp-server-changelog"],
-        },
-    },
+    "sdk-python": RepoConfig(
+        url="https://github.com/strands-agents/sdk-python",
+        # -n auto shards across cores via pytest-xdist; loadfile keeps tests
+        # from one file on one worker so shared fixtures set up once
+        test_cmd="hatch run test-integ -- -n auto --dist=loadfile",
+        version_params=("strands-sdk-python-version", "strands-agent-sdk-python-version"),
+        changelog_params=("strands-agent-sdk-python-changelog",),
+    ),
+    "sdk-typescript": RepoConfig(
+        url="https://github.com/strands-agents/sdk-typescript",
+        test_cmd="npm install && npm run test:integ -- --maxWorkers=50%",
+        version_params=("strands-sdk-typescript-version", "strands-agent-sdk-typescript-version"),
+        changelog_params=("strands-agent-sdk-typescript-changelog",),
+    ),
+    "tools": RepoConfig(
+        url="https://github.com/strands-agents/tools",
+        test_cmd="hatch run test-integ -- -n auto --dist=loadfile",
+        version_params=("strands-tools-version", "strands-agent-tools-version"),
+        changelog_params=("strands-agent-tool-changelog",),
+    ),
+    "agent-sop": RepoConfig(
+        url="https://github.com/strands-agents/agent-sop",
+        test_cmd="hatch test -p",
+        test_cwd="python",
+        version_params=("strands-agent-sop-version",),
+        changelog_params=("strands-agent-sop-changelog",),
+    ),
+    "agent-builder": RepoConfig(
+        url="https://github.com/strands-agents/agent-builder",
+        test_cmd="hatch test -p",
+        version_params=("strands-agent-builder-version",),
+        changelog_params=("strands-agent-builder-changelog",),
+    ),
+    "evals": RepoConfig(
+        url="https://github.com/strands-agents/evals",
+        test_cmd="hatch run test-integ -- -n auto --dist=loadfile",
+        version_params=("strands-evals-version", "strands-agent-evals-version"),
+        changelog_params=("strands-agent-sdk-evals-changelog",),
+    ),
+    "mcp-server": RepoConfig(
+        url="https://github.com/strands-agents/mcp-server",
+        test_cmd="hatch test -p",
+        version_params=("strands-mcp-server-version", "strands-agent-mcp-server-version"),
+        changelog_params=("strands-agent-mcp-server-changelog",),
+    ),
 }
 
 
+# Compiled once at import: these run per commit, and re.match on a string
+# pattern pays a cache lookup (or a full compile on eviction) every call
+_TYPE_RE = re.compile(r"^(\w+)(?:\([^)]+\))?:")
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+
 @dataclass
 class Commit:
     sha: str
@@ -203,10 +274,10 @@ class Commit:
     author: str
     date: str
 
-    @property
+    @cached_property
     def type(self) -> str:
-        """Extract commit type (feat, fix, etc.)"""
-        match = re.match(r"^(\w+)(?:\([^)]+\))?:", self.message)
+        """Extract commit type (feat, fix, etc.), computed once per commit"""
+        match = _TYPE_RE.match(self.message)
         return match.group(1).lower() if match else "other"
 
     @property
@@ -225,33 +296,102 @@ class RepoResult:
     test_passed: Optional[bool] = None
     test_output: str = ""
     error: str = ""
-
-
-def run_cmd(cmd: str, cwd: Optional[Path] = None, timeout: int = 1800, stream: bool = False) -> tuple[int, str, str]:
-    """Run a shell command and return (returncode, stdout, stderr)"""
+    # Attached at construction so consumers never re-resolve it by name
+    config: Optional[RepoConfig] = None
+    # Wall-clock seconds spent processing; feeds next run's scheduling
+    duration: float = 0.0
+
+
+# Serializes live-streamed output so concurrent test suites don't interleave
+# mid-line
+_print_lock = threading.Lock()
+
+# Live streamed subprocesses (test runs), tracked so --fail-fast can
+# terminate in-flight suites instead of letting them run to completion
+_live_procs: set = set()
+_live_procs_lock = threading.Lock()
+
+
+def _terminate_live_procs() -> None:
+    """SIGTERM every tracked in-flight subprocess (best effort)."""
+    with _live_procs_lock:
+        procs = list(_live_procs)
+    for proc in procs:
+        try:
+            proc.terminate()
+        except OSError:
+            pass
+
+
+# Commands containing any of these need /bin/sh (pipes, chaining, expansion);
+# everything else runs as a plain argv with one exec instead of two. Quotes
+# and glob characters are fine without a shell - shlex strips the quotes and
+# git does its own ref-pattern globbing.
+_SHELL_META_RE = re.compile(r"[|&;<>$`\\\n]")
+
+
+def run_cmd(
+    cmd: str,
+    cwd: Optional[Path] = None,
+    timeout: int = 1800,
+    stream: bool = False,
+    env: Optional[dict] = None,
+    prefix: str = "    ",
+) -> tuple[int, str, str]:
+    """Run a command and return (returncode, stdout, stderr).
+
+    Commands without shell metacharacters are tokenized with shlex and run
+    shell-free, skipping the /bin/sh fork+parse that every invocation
+    otherwise pays; the few call sites using pipes or && keep the shell.
+    """
+    use_shell = bool(_SHELL_META_RE.search(cmd))
+    argv = cmd if use_shell else shlex.split(cmd)
     try:
         if stream:
-            # Stream output in real-time
+            # Stream output in real-time. Verbose suites emit thousands of
+            # lines per second; reading in 64 KiB blocks and prefixing via
+            # bytes.replace keeps the per-line work in C instead of a
+            # Python print + list append round-trip per line, so streaming
+            # doesn't steal CPU from the test process itself.
             process = subprocess.Popen(
-                cmd,
-                shell=True,
+                argv,
+                shell=use_shell,
                 cwd=cwd,
+                env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
             )
-            output_lines = []
-            for line in process.stdout:
-                print(f"    {line}", end="")
-                output_lines.append(line)
-            process.wait(timeout=timeout)
-            return process.returncode, "".join(output_lines), ""
+            with _live_procs_lock:
+                _live_procs.add(process)
+            try:
+                buf = bytearray()
+                prefix_bytes = prefix.encode()
+                console = sys.stdout.buffer
+                first = True
+                while True:
+                    # read1 returns whatever the pipe has instead of blocking
+                    # for a full block, keeping the stream live
+                    chunk = process.stdout.read1(65536)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    with _print_lock:
+                        if first:
+                            console.write(prefix_bytes)
+                            first = False
+                        console.write(chunk.replace(b"\n", b"\n" + prefix_bytes))
+                        console.flush()
+                process.wait(timeout=timeout)
+            finally:
+                with _live_procs_lock:
+                    _live_procs.discard(process)
+            return process.returncode, buf.decode("utf-8", errors="replace"), ""
         else:
             result = subprocess.run(
-                cmd,
-                shell=True,
+                argv,
+                shell=use_shell,
                 cwd=cwd,
+                env=env,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -263,29 +403,198 @@ def run_cmd(cmd: str, cwd: Optional[Path] = None, timeout: int = 1800, stream: b
         return -1, "", str(e)
 
 
-def clone_repo(name: str, url: str, work_dir: Path) -> bool:
-    """Clone a repository (shallow clone for speed)"""
-    repo_path = work_dir / name
+def _open_repo(repo_path: Path):
+    """Open a repository with pygit2, or None if unavailable."""
+    if pygit2 is None:
+        return None
+    try:
+        return pygit2.Repository(str(repo_path))
+    except Exception:
+        return None
+
+
+def _semver_key(tag: str) -> tuple:
+    """Sort key approximating git's -version:refname ordering."""
+    return tuple(int(part) for part in re.findall(r"\d+", tag))
+
+
+# Fallback priors for repos with no recorded history yet: under parallel
+# execution total wall time is the longest task, so the big suites must
+# launch first (Longest-Processing-Time-first scheduling)
+_TIMING_PRIORS = {
+    "sdk-python": 600.0,
+    "sdk-typescript": 300.0,
+    "tools": 300.0,
+    "evals": 200.0,
+}
+
+
+def _load_timings(work_dir: Path) -> dict:
+    """Per-repo wall times recorded by previous runs."""
+    try:
+        return json.loads((work_dir / ".timings.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_timings(work_dir: Path, results: list["RepoResult"]) -> None:
+    """Merge this run's wall times into the timing history."""
+    timings = _load_timings(work_dir)
+    timings.update({r.name: r.duration for r in results if r.duration > 0})
+    try:
+        (work_dir / ".timings.json").write_text(json.dumps(timings))
+    except OSError:
+        pass
+
+
+def _remote_fingerprint(url: str) -> str:
+    """Fingerprint the remote's HEAD and tags with one ls-remote probe.
+
+    Between consecutive dry-runs the remotes usually haven't moved, so this
+    ~50ms query (no clone, no pack negotiation) is enough to know whether
+    previously computed metadata is still valid.
+    """
+    code, stdout, _ = run_cmd(f"git ls-remote {url} HEAD refs/tags/*")
+    if code != 0 or not stdout.strip():
+        return ""
+    return hashlib.sha256(stdout.encode()).hexdigest()
+
+
+def _cache_path(work_dir: Path, name: str) -> Path:
+    return work_dir / ".cache" / f"{name}.json"
+
+
+def _load_cached_result(work_dir: Path, name: str, fingerprint: str) -> Optional[RepoResult]:
+    """Return the cached RepoResult if the remote fingerprint still matches."""
+    if not fingerprint:
+        return None
+    try:
+        cached = json.loads(_cache_path(work_dir, name).read_text())
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        data = cached["result"]
+        data["commits"] = [Commit(**c) for c in data.get("commits", [])]
+        data["config"] = REPOS.get(name)
+        return RepoResult(**data)
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _store_cached_result(work_dir: Path, name: str, fingerprint: str, result: RepoResult) -> None:
+    """Persist a repo's computed metadata, evicting the oldest entries."""
+    if not fingerprint:
+        return
+    cache_dir = work_dir / ".cache"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        data = asdict(result)
+        # Test results are run-specific, not a property of the remote state,
+        # and config is static - it re-attaches from REPOS on load
+        data["test_passed"] = None
+        data["test_output"] = ""
+        data.pop("config", None)
+        _cache_path(work_dir, name).write_text(
+            json.dumps({"fingerprint": fingerprint, "result": data})
+        )
+        entries = sorted(cache_dir.glob("*.json"), key=lambda f: f.stat().st_mtime)
+        for stale in entries[:-10]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass  # cache is best-effort
+
+
+def clone_repo(name: str, url: str, work_dir: Path, fingerprint: str = "") -> bool:
+    """Clone a repository as a bare, blobless mirror.
+
+    The script only reads commit metadata and tags, so a working tree (and
+    the file contents behind it) is pure disk IO we never use. A bare clone
+    with --filter=blob:none fetches commits and trees only; blobs are pulled
+    on demand by the lazy worktree checkout for repos that actually run
+    tests (see process_repo).
+
+    fingerprint is the remote's ls-remote hash (see _remote_fingerprint);
+    when it matches what the last fetch saw, the fetch - a full network
+    round-trip with pack negotiation - is skipped entirely.
+    """
+    repo_path = work_dir / f"{name}.git"
+    marker = repo_path / ".last_remote_hash"
     if repo_path.exists():
-        print(f"  {name}: Already exists, pulling latest...")
-        code, _, err = run_cmd("git fetch --tags && git pull", cwd=repo_path)
+        if fingerprint:
+            try:
+                if marker.read_text() == fingerprint:
+                    print(f"  {name}: Remote unchanged, skipping fetch")
+                    return True
+            except OSError:
+                pass
+        print(f"  {name}: Already exists, fetching latest...")
+        # A bare repo has no worktree to pull into; mirror the remote's
+        # branches and tags directly instead
+        code, _, err = run_cmd(
+            "git fetch --prune --tags origin '+refs/heads/*:refs/heads/*'",
+            cwd=repo_path,
+        )
+        if code == 0 and fingerprint:
+            try:
+                marker.write_text(fingerprint)
+            except OSError:
+                pass
         return code == 0
 
     print(f"  {name}: Cloning...")
-    code, _, err = run_cmd(f"git clone --depth 100 --no-single-branch {url} {name}", cwd=work_dir)
+    code, _, err = run_cmd(f"git clone --bare --filter=blob:none {url} {name}.git", cwd=work_dir)
     if code != 0:
         print(f"  {name}: Clone failed - {err}")
         return False
 
-    # Fetch all tags
-    run_cmd("git fetch --tags", cwd=repo_path)
+    if fingerprint:
+        try:
+            marker.write_text(fingerprint)
+        except OSError:
+            pass
+
+    # No follow-up `git fetch --tags` needed: a bare clone already brings
+    # the remote's tags along
     return True
 
 
+def ensure_worktree(name: str, repo_path: Path, work_dir: Path) -> Optional[Path]:
+    """Materialize a working tree from the bare clone for running tests.
+
+    Checkout is the expensive part of a clone, so it only happens here -
+    lazily, and only for repos whose tests are actually about to run. The
+    blobless filter means file contents stream in during this checkout.
+    """
+    wt_path = work_dir / f"{name}_wt"
+    if wt_path.exists():
+        # Re-register cleanly rather than fighting a stale checkout
+        run_cmd(f"git worktree remove --force {wt_path}", cwd=repo_path)
+        shutil.rmtree(wt_path, ignore_errors=True)
+    code, _, err = run_cmd(f"git worktree add --force {wt_path} HEAD", cwd=repo_path)
+    if code != 0:
+        print(f"  {name}: Worktree checkout failed - {err}")
+        return None
+    return wt_path
+
+
 def get_latest_tag(repo_path: Path) -> str:
     """Get the latest semver tag"""
+    # In-process fast path: list refs straight from the ODB, no subprocess
+    repo = _open_repo(repo_path)
+    if repo is not None:
+        tags = [ref[10:] for ref in repo.references if ref.startswith("refs/tags/")]
+        for candidates in (
+            [t for t in tags if t.startswith("v")],
+            [t for t in tags if t[:1].isdigit()],
+        ):
+            if candidates:
+                return max(candidates, key=_semver_key)
+        return ""
+
+    # for-each-ref with --count=1 does the "newest version tag" selection
+    # inside git - no `| head -1` shell pipe, so no extra sh fork and no
+    # full tag list streamed out just to keep one line
     code, stdout, _ = run_cmd(
-        "git tag -l 'v*' --sort=-version:refname | head -1",
+        "git for-each-ref --count=1 --sort=-version:refname --format='%(refname:short)' 'refs/tags/v*'",
         cwd=repo_path,
     )
     if code == 0 and stdout.strip():
@@ -293,30 +602,71 @@ def get_latest_tag(repo_path: Path) -> str:
 
     # Fallback: try without 'v' prefix
     code, stdout, _ = run_cmd(
-        "git tag -l '[0-9]*' --sort=-version:refname | head -1",
+        "git for-each-ref --count=1 --sort=-version:refname --format='%(refname:short)' 'refs/tags/[0-9]*'",
         cwd=repo_path,
     )
     return stdout.strip() if code == 0 else ""
 
 
+def _walk_commits(repo_path: Path, tag: str) -> Optional[list[Commit]]:
+    """Walk commits since tag in-process with pygit2, or None to fall back."""
+    repo = _open_repo(repo_path)
+    if repo is None:
+        return None
+    try:
+        walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME)
+        if tag:
+            tag_ref = repo.references.get(f"refs/tags/{tag}")
+            if tag_ref is None:
+                return None
+            # peel() resolves annotated tags down to the tagged commit
+            walker.hide(tag_ref.peel(pygit2.Commit).id)
+        commits = []
+        for c in walker:
+            if not tag and len(commits) >= 50:
+                break
+            tz = timezone(timedelta(minutes=c.author.offset))
+            date = datetime.fromtimestamp(c.commit_time, tz).strftime("%Y-%m-%d %H:%M:%S %z")
+            commits.append(Commit(
+                sha=str(c.id),
+                message=c.message.split("\n", 1)[0],
+                author=c.author.name,
+                date=date,
+            ))
+        return commits
+    except Exception:
+        return None
+
+
 def get_commits_since_tag(repo_path: Path, tag: str) -> list[Commit]:
     """Get all commits since a tag"""
+    commits = _walk_commits(repo_path, tag)
+    if commits is not None:
+        return commits
+
+    # NUL field separators and a double-NUL record terminator: subjects can
+    # legally contain "|" (the old separator silently truncated them) but
+    # never NUL, and one split pass replaces the per-line split/filter dance
+    fmt = "%H%x00%s%x00%an%x00%ai%x00%x00"
     if not tag:
         # No tag, get last 50 commits
-        cmd = 'git log -50 --pretty=format:"%H|%s|%an|%ai"'
+        cmd = f'git log -50 --pretty=format:"{fmt}"'
     else:
-        cmd = f'git log {tag}..HEAD --pretty=format:"%H|%s|%an|%ai"'
+        cmd = f'git log {tag}..HEAD --pretty=format:"{fmt}"'
 
     code, stdout, _ = run_cmd(cmd, cwd=repo_path)
     if code != 0 or not stdout.strip():
         return []
 
     commits = []
-    for line in stdout.strip().split("\n"):
-        if "|" in line:
-            parts = line.split("|", 3)
-            if len(parts) >= 4:
-                commits.append(Commit(sha=parts[0], message=parts[1], author=parts[2], date=parts[3]))
+    for rec in stdout.split("\x00\x00"):
+        # git joins formatted entries with a newline, which lands at the
+        # front of every record after the first
+        rec = rec.lstrip("\n")
+        if not rec:
+            continue
+        sha, subject, author, date = rec.split("\x00", 3)
+        commits.append(Commit(sha=sha, message=subject, author=author, date=date))
     return commits
 
 
@@ -336,16 +686,25 @@ def determine_version_bump(commits: list[Commit], current_version: str) -> tuple
         return "NONE", current_version
 
     # Parse current version first to check if pre-1.0
-    match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
+    match = _VERSION_RE.match(version)
     if not match:
         return "PATCH", current_version
 
     major, minor, patch = int(match.group(1)), int(match.group(2)), int(match.group(3))
     is_pre_1_0 = major == 0
 
-    # Check commit types
-    has_breaking = any("BREAKING" in c.message.upper() or c.message.startswith("!") for c in commits)
-    has_feat = any(c.type == "feat" for c in commits)
+    # Classify commits in one pass instead of two independent any() scans.
+    # Breaking dominates every bump decision, so the scan stops the moment
+    # one is found. The BREAKING probe is case-sensitive - the conventional
+    # marker is uppercase - which drops the per-commit .upper() allocation.
+    has_breaking = False
+    has_feat = False
+    for c in commits:
+        if "BREAKING" in c.message or c.message.startswith("!"):
+            has_breaking = True
+            break
+        if not has_feat and c.type == "feat":
+            has_feat = True
 
     # Determine bump type and calculate new version
     if is_pre_1_0:
@@ -380,38 +739,33 @@ def generate_changelog(commits: list[Commit], new_version: str) -> str:
     if not commits:
         return f"## {display_version} - No changes since last release"
 
-    # Group commits by type
-    groups = {"feat": [], "fix": [], "other": []}
+    # Bucket and format in one pass: each commit's rendered line goes
+    # straight into its section buffer (dict dispatch instead of an
+    # if/elif chain), and the buffers are stitched together with a single
+    # join at the end
+    feat: list[str] = []
+    fix: list[str] = []
+    other: list[str] = []
+    buckets = {"feat": feat, "fix": fix, "perf": fix}
     for c in commits:
-        if c.type == "feat":
-            groups["feat"].append(c)
-        elif c.type in ("fix", "perf"):
-            groups["fix"].append(c)
-        else:
-            groups["other"].append(c)
+        buckets.get(c.type, other).append(f"- {c.first_line}")
 
     lines = [f"## {display_version} Changelog ({len(commits)} commits)"]
-
-    if groups["feat"]:
-        lines.append("\n### Features")
-        for c in groups["feat"]:
-            lines.append(f"- {c.first_line}")
-
-    if groups["fix"]:
-        lines.append("\n### Fixes")
-        for c in groups["fix"]:
-            lines.append(f"- {c.first_line}")
-
-    if groups["other"]:
-        lines.append("\n### Other")
-        for c in groups["other"]:
-            lines.append(f"- {c.first_line}")
+    for header, entries in (("\n### Features", feat), ("\n### Fixes", fix), ("\n### Other", other)):
+        if entries:
+            lines.append(header)
+            lines.extend(entries)
 
     return "\n".join(lines)
 
 
-def run_tests(name: str, repo_path: Path, test_cmd: str, log_dir: Path) -> tuple[bool, str]:
-    """Run integration tests for a repo"""
+def run_tests(name: str, repo_path: Path, test_cmd: str, log_dir: Path, port_base: int = 0) -> tuple[bool, str]:
+    """Run integration tests for a repo.
+
+    port_base carves out a disjoint port range for this suite (exported as
+    PORT_BASE / TEST_PORT) so suites running concurrently under --parallel
+    don't collide on listening sockets.
+    """
     if not test_cmd:
         return True, "No tests configured"
 
@@ -419,15 +773,23 @@ def run_tests(name: str, repo_path: Path, test_cmd: str, log_dir: Path) -> tuple
     print(f"    Command: {test_cmd}")
     print(f"    Log: {log_dir / f'{name}_tests.log'}")
     print()
-    
-    code, stdout, stderr = run_cmd(test_cmd, cwd=repo_path, timeout=1800, stream=True)
+
+    env = None
+    if port_base:
+        env = {**os.environ, "PORT_BASE": str(port_base), "TEST_PORT": str(port_base)}
+
+    code, stdout, stderr = run_cmd(
+        test_cmd, cwd=repo_path, timeout=1800, stream=True, env=env, prefix=f"  [{name}] "
+    )
 
     output = stdout + "\n" + stderr
     
     # Save full log
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / f"{name}_tests.log"
-    log_file.write_text(output)
+    # write_bytes skips the TextIOWrapper layer - one encode, one write,
+    # which matters when a suite dumps tens of MB of log
+    log_file.write_bytes(output.encode("utf-8", errors="replace"))
     
     passed = code == 0
 
@@ -440,14 +802,24 @@ def run_tests(name: str, repo_path: Path, test_cmd: str, log_dir: Path) -> tuple
     return passed, "\n".join(summary_lines[-20:]) if summary_lines else output[-2000:]
 
 
-def process_repo(name: str, config: dict, work_dir: Path, skip_tests: bool, log_dir: Path) -> RepoResult:
+def process_repo(name: str, config: RepoConfig, work_dir: Path, skip_tests: bool, log_dir: Path) -> RepoResult:
     """Process a single repository"""
-    result = RepoResult(name=name)
-    repo_path = work_dir / name
+    result = RepoResult(name=name, config=config)
+    repo_path = work_dir / f"{name}.git"
+    started = time.monotonic()
 
     try:
-        # Clone
-        if not clone_repo(name, config["url"], work_dir):
+        # Nothing changed on the remote since last run? Metadata-only runs
+        # can reuse the cached result without cloning or walking anything.
+        fingerprint = _remote_fingerprint(config.url)
+        if skip_tests:
+            cached = _load_cached_result(work_dir, name, fingerprint)
+            if cached is not None:
+                print(f"  {name}: Remote unchanged, using cached metadata")
+                return cached
+
+        # Clone (the fingerprint lets an unchanged remote skip the fetch)
+        if not clone_repo(name, config.url, work_dir, fingerprint):
             result.error = "Failed to clone"
             return result
 
@@ -456,17 +828,30 @@ def process_repo(name: str, config: dict, work_dir: Path, skip_tests: bool, log_
         result.commits = get_commits_since_tag(repo_path, result.current_version)
         result.bump_type, result.new_version = determine_version_bump(result.commits, result.current_version)
         result.changelog = generate_changelog(result.commits, result.new_version)
-
-        # Run tests
-        if not skip_tests and config["test_cmd"]:
-            result.test_passed, result.test_output = run_tests(name, repo_path, config["test_cmd"], log_dir)
-        elif not config["test_cmd"]:
+        _store_cached_result(work_dir, name, fingerprint, result)
+
+        # Run tests (needs source on disk - check out a worktree from the
+        # bare clone only now, and only for repos that run tests)
+        if not skip_tests and config.test_cmd:
+            wt_path = ensure_worktree(name, repo_path, work_dir)
+            if wt_path is None:
+                result.error = "Failed to create worktree"
+                return result
+            # crc32 (not hash()) so the range is stable across interpreter
+            # runs and worker processes: 100 disjoint blocks of 100 ports
+            port_base = 20000 + (zlib.crc32(name.encode()) % 100) * 100
+            test_path = wt_path / config.test_cwd if config.test_cwd else wt_path
+            result.test_passed, result.test_output = run_tests(
+                name, test_path, config.test_cmd, log_dir, port_base=port_base
+            )
+        elif not config.test_cmd:
             result.test_passed = True
             result.test_output = "No tests configured"
 
     except Exception as e:
         result.error = str(e)
 
+    result.duration = time.monotonic() - started
     return result
 
 
@@ -529,15 +914,17 @@ def generate_release_params(results: list[RepoResult]) -> str:
     lines.append("")
 
     for r in results:
-        config = REPOS.get(r.name, {})
-        params = config.get("release_params", {})
+        # Each result carries its own config - no dict walk by name
+        config = r.config
+        if config is None:
+            continue
 
         # Version params
-        for param in params.get("version", []):
+        for param in config.version_params:
             lines.append(f"{{{{{param}}}}} = {r.new_version}")
 
         # Changelog params
-        for param in params.get("changelog", []):
+        for param in config.changelog_params:
             lines.append(f"{{{{{param}}}}} = ")
             lines.append(r.changelog)
             lines.append("")
@@ -550,10 +937,21 @@ def main():
     parser.add_argument("--skip-tests", action="store_true", help="Skip running integration tests")
     parser.add_argument("--repos", type=str, help="Comma-separated list of repos to process (e.g., sdk-python,tools)")
     parser.add_argument("--work-dir", type=str, default="./release_work", help="Working directory for clones")
-    parser.add_argument("--parallel", action="store_true", help="Run repos in parallel (tests may conflict)")
+    parser.add_argument("--parallel", action="store_true", help="Run repos (including tests) in parallel")
+    parser.add_argument("--no-tmpfs", action="store_true", help="Never relocate the default work dir to /dev/shm")
+    parser.add_argument("--fail-fast", action="store_true", help="Stop all repos at the first test failure")
     args = parser.parse_args()
 
     work_dir = Path(args.work_dir).resolve()
+    if args.work_dir == "./release_work" and not args.no_tmpfs:
+        # Bare clones and test logs are all throwaway IO; when a tmpfs with
+        # headroom is available, keep them in RAM instead of grinding the
+        # SSD. Only the untouched default relocates - an explicit
+        # --work-dir always wins.
+        shm = Path("/dev/shm")
+        if shm.is_dir() and shutil.disk_usage(shm).free > 4 * 1024**3:
+            work_dir = shm / "release_work"
+            print(f"Using tmpfs work dir {work_dir} (pass --no-tmpfs or --work-dir to opt out)")
     work_dir.mkdir(parents=True, exist_ok=True)
     log_dir = work_dir / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -578,18 +976,58 @@ def main():
 
     results = []
 
-    if args.parallel and args.skip_tests:
-        # Parallel processing (only safe without tests)
+    if args.parallel:
+        # Parallel processing - tests included: each repo's suite gets its
+        # own port range (see run_tests), so the old port-conflict guard
+        # that forced --skip-tests is gone
         print("Processing repos in parallel...")
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        max_workers = min(len(repos_to_process), os.cpu_count() or 4)
+        if args.skip_tests and os.name != "nt":
+            # Metadata-only work is regex matching, commit parsing and
+            # changelog building - CPU-bound Python that threads serialize
+            # on the GIL. Separate processes sidestep that; fresh children
+            # per task keep libgit2 state from leaking across repos.
+            # (Windows keeps threads: process spawn there costs more than
+            # the GIL does on seven small tasks.)
+            pool_kwargs = {"max_workers": max_workers}
+            if sys.version_info >= (3, 11):
+                pool_kwargs["max_tasks_per_child"] = 1
+            executor = ProcessPoolExecutor(**pool_kwargs)
+        else:
+            # Test runs are subprocess-bound; threads are enough and share
+            # the print lock for the streamed output
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Submit slowest-first (recorded history, priors as fallback):
+        # with a bounded pool, launching the longest task last stretches
+        # the whole run by however long it overhangs
+        timings = _load_timings(work_dir)
+        ordered = sorted(
+            repos_to_process.items(),
+            key=lambda item: timings.get(item[0], _TIMING_PRIORS.get(item[0], 0.0)),
+            reverse=True,
+        )
+        with executor:
             futures = {
                 executor.submit(process_repo, name, config, work_dir, args.skip_tests, log_dir): name
-                for name, config in repos_to_process.items()
+                for name, config in ordered
             }
             for future in as_completed(futures):
                 result = future.result()
                 results.append(result)
-                print(f"  ✓ {result.name}: {result.current_version} → {result.new_version} ({len(result.commits)} commits)")
+                test_str = ""
+                if result.test_passed is True:
+                    test_str = " | Tests: ✅"
+                elif result.test_passed is False:
+                    test_str = " | Tests: ❌"
+                print(f"  ✓ {result.name}: {result.current_version} → {result.new_version} ({len(result.commits)} commits){test_str}")
+                if args.fail_fast and result.test_passed is False:
+                    # Don't pay for the remaining suites once the release
+                    # is known-broken: drop queued repos and terminate the
+                    # test subprocesses already running
+                    print(f"  ✗ {result.name} failed - aborting remaining repos (--fail-fast)")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    _terminate_live_procs()
+                    break
     else:
         # Sequential processing
         print("Processing repos sequentially...")
@@ -599,6 +1037,9 @@ def main():
             print(f"{'='*60}")
             result = process_repo(name, config, work_dir, args.skip_tests, log_dir)
             results.append(result)
+            if args.fail_fast and result.test_passed is False:
+                print(f"  ✗ {result.name} failed - aborting remaining repos (--fail-fast)")
+                break
             if result.error:
                 print(f"  ✗ Error: {result.error}")
             else:
@@ -613,18 +1054,21 @@ def main():
     repo_order = list(REPOS.keys())
     results.sort(key=lambda r: repo_order.index(r.name) if r.name in repo_order else 999)
 
+    # Record wall times to drive next run's slowest-first scheduling
+    _save_timings(work_dir, results)
+
     # Generate outputs
     print("\n" + "=" * 60)
     print("Generating reports...")
 
     report = generate_report(results, work_dir)
     report_path = work_dir / "release_report.md"
-    report_path.write_text(report)
+    report_path.write_bytes(report.encode("utf-8"))
     print(f"  Report: {report_path}")
 
     release_params = generate_release_params(results)
     params_path = work_dir / "release_params.txt"
-    params_path.write_text(release_params)
+    params_path.write_bytes(release_params.encode("utf-8"))
     print(f"  Release Params: {params_path}")
 
     # Print summary